@@ -4,7 +4,7 @@ import logging
 from enum import StrEnum
 from mimetypes import guess_extension, guess_type
 from pathlib import Path
-from typing import Any, Final, cast
+from typing import TYPE_CHECKING, Any, Final
 from uuid import UUID
 
 import aiofiles
@@ -22,7 +22,6 @@ from .models.attachment import (
     AttachmentCreateResponse,
     AttachmentsResponse,
 )
-from .models.base import ULinks
 from .models.page import (
     GetPageParams,
     PageBodyFormat,
@@ -33,6 +32,9 @@ from .models.page import (
 )
 from .models.space import SpacesResponse
 
+if TYPE_CHECKING:
+    from .pool import ToolkitPool
+
 _4KB_In_Bytes = 4 * 1024
 
 
@@ -63,10 +65,12 @@ class ConfluenceToolkit:
         root: str,
         v1urls: V1EndpointsSettings | None = None,
         v2urls: V2EndpointsSettings | None = None,
+        pool: "ToolkitPool | None" = None,
     ) -> None:
         self.root = root
         self.v1urls = v1urls or self.V1Endpoints()
         self.v2urls = v2urls or self.V2Endpoints()
+        self.pool = pool
 
         self.session = None
         self.credentials = BasicAuth(
@@ -86,6 +90,23 @@ class ConfluenceToolkit:
     def construct_url(self, suffix: str) -> str:
         return f"{self.root}{suffix}"
 
+    def new_session(self) -> ClientSession:
+        """Open a session, on the pool's shared connector if any."""
+        if self.pool is None:
+            return ClientSession()
+        return ClientSession(
+            connector=self.pool.connector,
+            connector_owner=False,
+        )
+
+    async def throttle_request(self, url: str) -> None:
+        if self.pool is not None:
+            await self.pool.throttle_request(url)
+
+    async def throttle_bandwidth(self, nbytes: int) -> None:
+        if self.pool is not None:
+            await self.pool.throttle_bandwidth(nbytes)
+
     async def req_in_session(
         self,
         method: RequestMethod,
@@ -96,15 +117,19 @@ class ConfluenceToolkit:
 
         https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientSession
         """
+        url = self.construct_url(path)
+        await self.throttle_request(url)
         async with (
-            ClientSession() as session,
+            self.new_session() as session,
             session.request(
                 method,
-                self.construct_url(path),
+                url,
                 auth=self.credentials,
                 **kwargs,
             ) as response,
         ):
+            body = await response.read()
+            await self.throttle_bandwidth(len(body))
             text = await response.text()
             try:
                 response.raise_for_status()
@@ -150,12 +175,14 @@ class ConfluenceToolkit:
         async with aiofiles.open(filepath, "rb") as asyncfile:
             content_type = content_type or guess_type(filepath)[0]
             filename = filename or filepath.name
+            content = await asyncfile.read()
+            await self.throttle_bandwidth(len(content))
             formdata = FormData()
             formdata.add_field("minorEdit", "true")
             formdata.add_field("comment", comment)
             formdata.add_field(
                 "file",
-                await asyncfile.read(),
+                content,
                 content_type=content_type,
                 filename=filename,
             )
@@ -190,10 +217,12 @@ class ConfluenceToolkit:
         if parent_folder:
             Path(parent_folder).mkdir(parents=True, exist_ok=True)
 
+        full_url = self.construct_url(url)
+        await self.throttle_request(full_url)
         async with (
-            ClientSession() as session,
+            self.new_session() as session,
             session.get(
-                self.construct_url(url),
+                full_url,
                 auth=self.credentials,
             ) as resp,
         ):
@@ -202,6 +231,7 @@ class ConfluenceToolkit:
             dst = Path(parent_folder or "", dst_suffix)
             async with aiofiles.open(dst, "wb+") as asyncfile:
                 async for chunk in resp.content.iter_chunked(chunk_size):
+                    await self.throttle_bandwidth(len(chunk))
                     await asyncfile.write(chunk)
 
     async def download_attachments(
@@ -225,21 +255,29 @@ class ConfluenceToolkit:
 
         tasks = [
             asyncio.create_task(
-                self.download_file(
-                    str(cast(ULinks, attachment.uLinks).download),
-                    file_id=attachment.extensions.fileId,
-                    media_type=attachment.extensions.mediaType,
+                self.download_attachment(
+                    attachment,
                     parent_folder=parent_folder,
                 ),
             )
             for attachment in valid_attachments
-            if cast(ULinks, attachment.uLinks).download
         ]
         await asyncio.wait(tasks, return_when=asyncio.ALL_COMPLETED)
 
-    async def download_attachment(self) -> None:
-        """Download attachment."""
-        # TODO: implement this
+    async def download_attachment(
+        self,
+        attachment: Attachment,
+        parent_folder: Path | None = None,
+    ) -> None:
+        """Download a single attachment, named after its file ID."""
+        if attachment.uLinks is None or not attachment.uLinks.download:
+            raise ValueError(f"attachment {attachment.id} has no download url")
+        await self.download_file(
+            str(attachment.uLinks.download),
+            file_id=attachment.extensions.fileId,
+            media_type=attachment.extensions.mediaType,
+            parent_folder=parent_folder,
+        )
 
     async def get_page(
         self,
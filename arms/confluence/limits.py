@@ -0,0 +1,36 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Asynchronous token bucket refilled at `rate` tokens per second.
+
+    Acquiring more tokens than the bucket holds is allowed,
+    the bucket then goes into debt and later callers wait it out.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated_at) * self.rate,
+        )
+        self._updated_at = now
+
+    async def acquire(self, amount: float = 1) -> None:
+        async with self._lock:
+            self._refill()
+            required = min(amount, self.capacity)
+            if self._tokens < required:
+                await asyncio.sleep((required - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= amount
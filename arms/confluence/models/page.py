@@ -1,12 +1,21 @@
 import json
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from datetime import datetime
 from enum import StrEnum, auto
-from typing import Annotated, Any, Literal
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    ClassVar,
+    Literal,
+    TypeVar,
+    cast,
+)
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
-from ..utils import Soup
+from ..utils import HTMLParser
 from .base import (
     BaseUnit,
     DumpByConfigMixin,
@@ -16,6 +25,11 @@ from .base import (
     ULinks,
 )
 
+if TYPE_CHECKING:
+    from ..soup import Soup
+
+ParsedType = TypeVar("ParsedType")
+
 
 class PageBodyFormat(StrEnum):
     Storage = "storage"
@@ -73,9 +87,31 @@ class PageContentVersion(BaseModel):
 
 
 class PageBodyRef(BaseModel, ABC):
+    """Reference to a page body in a given representation.
+
+    Parsed contents are cached per instance and dropped whenever `value`
+    is reassigned. They are shared between reads, mutating them in place
+    would affect later reads of `content` as well.
+    """
+
     value: str
     representation: Literal[PageBodyFormat.Storage, PageBodyFormat.Atlas]
 
+    _parsed_value: str | None = PrivateAttr(default=None)
+    _parsed: dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def _cached(
+        self,
+        key: str,
+        parse: Callable[[str], ParsedType],
+    ) -> ParsedType:
+        if self._parsed_value is not self.value:
+            self._parsed = {}
+            self._parsed_value = self.value
+        if key not in self._parsed:
+            self._parsed[key] = parse(self.value)
+        return cast(ParsedType, self._parsed[key])
+
     @property
     @abstractmethod
     def content(self) -> Any:
@@ -83,11 +119,22 @@ class PageBodyRef(BaseModel, ABC):
 
 
 class PageBodyStorageRef(PageBodyRef):
+    Parser: ClassVar[HTMLParser] = HTMLParser.Builtin
     representation: Literal[PageBodyFormat.Storage] = PageBodyFormat.Storage
 
+    def parse(self, parser: HTMLParser | None = None) -> "Soup":
+        """Parse the body with the given parser, `Parser` by default.
+
+        Set `Parser` to `HTMLParser.fastest()` to use lxml when installed.
+        """
+        from ..soup import Soup
+
+        parser = parser or self.Parser
+        return self._cached(parser, lambda value: Soup(value, parser))
+
     @property
-    def content(self) -> Soup:
-        return Soup(self.value, "html.parser")
+    def content(self) -> "Soup":
+        return self.parse()
 
 
 class PageBodyAtlasRef(PageBodyRef):
@@ -95,7 +142,7 @@ class PageBodyAtlasRef(PageBodyRef):
 
     @property
     def content(self) -> dict[str, Any]:
-        return json.loads(self.value)
+        return self._cached("json", json.loads)
 
 
 class PageBodyStorage(BaseModel):
@@ -156,6 +203,10 @@ class GetPageParams(DumpByConfigMixin, BaseModel):
     _DumpConfig = DumpConfig(by_alias=True)
 
     id: list[int] | None = None
+    space_id: Annotated[
+        list[int] | None,
+        Field(alias="space-id"),
+    ] = None
     sort: str | None = None
     status: PageStatus | None = None
     title: str | None = None
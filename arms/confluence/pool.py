@@ -0,0 +1,112 @@
+from urllib.parse import urlsplit
+
+from aiohttp import TCPConnector
+
+from .api import ConfluenceToolkit
+from .creds import BasicAuthCredentials
+from .endpoints import V1Endpoints, V2Endpoints
+from .limits import TokenBucket
+from .transfer import TransferHelper
+
+type ToolkitKey = tuple[str, str, str, str, str]
+
+
+class ToolkitPool:
+    """Registry of toolkits sharing connections and rate limits.
+
+    Toolkits are keyed by their root URL, credentials and endpoints,
+    all of them send requests through a single connector, which caps
+    the total and per-host number of in-flight requests. Request rate
+    per host and the overall bandwidth can be capped as well.
+
+    The connector is bound to the running event loop,
+    `close` should be awaited before the loop terminates.
+    """
+
+    def __init__(
+        self,
+        max_requests: int = 100,
+        max_requests_per_host: int = 10,
+        max_requests_per_second_per_host: float | None = None,
+        max_bytes_per_second: float | None = None,
+    ) -> None:
+        self.max_requests = max_requests
+        self.max_requests_per_host = max_requests_per_host
+        self.max_requests_per_second_per_host = (
+            max_requests_per_second_per_host
+        )
+        self.bandwidth_limiter = (
+            TokenBucket(max_bytes_per_second) if max_bytes_per_second else None
+        )
+
+        self._toolkits: dict[ToolkitKey, ConfluenceToolkit] = {}
+        self._host_limiters: dict[str, TokenBucket] = {}
+        self._connector: TCPConnector | None = None
+
+    @property
+    def connector(self) -> TCPConnector:
+        """Shared connector, created lazily inside the running loop."""
+        if self._connector is None or self._connector.closed:
+            self._connector = TCPConnector(
+                limit=self.max_requests,
+                limit_per_host=self.max_requests_per_host,
+            )
+        return self._connector
+
+    def get(
+        self,
+        credentials: BasicAuthCredentials,
+        root: str,
+        v1urls: V1Endpoints | None = None,
+        v2urls: V2Endpoints | None = None,
+    ) -> ConfluenceToolkit:
+        v1urls = v1urls or ConfluenceToolkit.V1Endpoints()
+        v2urls = v2urls or ConfluenceToolkit.V2Endpoints()
+        key = (
+            root,
+            credentials.username,
+            credentials.password,
+            v1urls.model_dump_json(),
+            v2urls.model_dump_json(),
+        )
+        if key not in self._toolkits:
+            self._toolkits[key] = ConfluenceToolkit(
+                credentials,
+                root,
+                v1urls=v1urls,
+                v2urls=v2urls,
+                pool=self,
+            )
+        return self._toolkits[key]
+
+    def transfer_helper(
+        self,
+        src_credentials: BasicAuthCredentials,
+        src_root: str,
+        dst_credentials: BasicAuthCredentials,
+        dst_root: str,
+    ) -> TransferHelper:
+        return TransferHelper(
+            self.get(src_credentials, src_root),
+            self.get(dst_credentials, dst_root),
+        )
+
+    async def throttle_request(self, url: str) -> None:
+        if not self.max_requests_per_second_per_host:
+            return
+        host = urlsplit(url).netloc
+        if host not in self._host_limiters:
+            self._host_limiters[host] = TokenBucket(
+                self.max_requests_per_second_per_host,
+            )
+        await self._host_limiters[host].acquire()
+
+    async def throttle_bandwidth(self, nbytes: int) -> None:
+        if self.bandwidth_limiter is None:
+            return
+        await self.bandwidth_limiter.acquire(nbytes)
+
+    async def close(self) -> None:
+        if self._connector is not None:
+            await self._connector.close()
+            self._connector = None
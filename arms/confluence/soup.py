@@ -0,0 +1,22 @@
+from bs4 import BeautifulSoup
+from bs4.formatter import HTMLFormatter
+
+from .utils import HTMLParser
+
+
+class Soup(BeautifulSoup):
+    def prettify(
+        self,
+        encoding: str | None = None,
+        formatter: HTMLFormatter | None = None,
+        indent: int = 4,
+    ) -> str:
+        formatter = formatter or HTMLFormatter(indent=indent)
+        return super().prettify(encoding=encoding, formatter=formatter)
+
+
+def loadhtml(
+    content: str,
+    parser: HTMLParser = HTMLParser.Builtin,
+) -> BeautifulSoup:
+    return BeautifulSoup(content, parser)
@@ -9,6 +9,7 @@ from aiofiles.tempfile import TemporaryDirectory
 from .api import ConfluenceToolkit
 from .exc import ClientError
 from .models.ancestor import Ancestor, AncestorType
+from .models.attachment import Attachment, AttachmentCreateResponse
 from .models.errors import ErrorCode, ResponseError
 from .models.page import (
     GetPageParams,
@@ -16,6 +17,7 @@ from .models.page import (
     PageBodyAtlasRef,
     PageBodyFormat,
     PageBodyStorageRef,
+    PageContent,
     PageCreate,
     PageStatus,
     PageStatusCreate,
@@ -43,31 +45,21 @@ class TransferHelper:
         self.st = src_toolkit
         self.dt = dst_toolkit
 
-    async def _transfer_page_in_tempdir(
+    async def _create_dst_page(
         self,
-        src_page_id: PageId,
+        src_page: asyncio.Task[PageContent],
+        downloads: list[asyncio.Task[bool]],
         space_id: str,
         parent_id: str,
-        tempdir: Path,
         title: str | None = None,
-    ) -> None:
-        src_page = await self.st.get_page(
-            src_page_id,
-            fmt=PageBodyFormat.Atlas,
-        )
-        src_body: PageBodyAtlas = cast(PageBodyAtlas, src_page.body)
-        src_content = src_body.atlas_doc_format.content
-        src_att_response = await self.st.get_attachments_from_page(src_page_id)
-        src_attachments = src_att_response.results
-
-        if len(src_attachments):
-            await self.st.download_attachments(
-                src_attachments,
-                parent_folder=tempdir,
-            )
+    ) -> PageContent:
+        """Create the page once every attachment is downloaded.
 
-        title = title or f"{src_page.title} (cloned)"
-        page_created = await self.dt.create_page(
+        A failed download then leaves no empty page behind.
+        """
+        title = title or f"{(await src_page).title} (cloned)"
+        await asyncio.gather(*downloads)
+        return await self.dt.create_page(
             PageCreate(
                 spaceId=space_id,
                 status=PageStatusCreate.Current,
@@ -80,30 +72,114 @@ class TransferHelper:
             ),
         )
 
+    async def _download_attachment(
+        self,
+        attachment: Attachment,
+        tempdir: Path,
+    ) -> bool:
+        """Download an attachment, returning whether it has a download."""
+        if attachment.uLinks is None or not attachment.uLinks.download:
+            return False
+        await self.st.download_attachment(attachment, parent_folder=tempdir)
+        return True
+
+    async def _upload_attachment(
+        self,
+        attachment: Attachment,
+        tempdir: Path,
+        download: asyncio.Task[bool],
+        dst_page: asyncio.Task[PageContent],
+    ) -> AttachmentCreateResponse | None:
+        """Upload a downloaded attachment once the page exists."""
+        if not await download:
+            return None
+        return await self.dt.create_attachment(
+            str((await dst_page).id),
+            tempdir / attachment.extensions.filename,
+            comment=self.Comment,
+            content_type=attachment.extensions.suffix,
+            filename=attachment.title,
+        )
+
+    async def _transfer_page_in_tempdir(
+        self,
+        src_page_id: PageId,
+        space_id: str,
+        parent_id: str,
+        tempdir: Path,
+        title: str | None = None,
+    ) -> None:
+        """Transfer a page as a dependency-driven pipeline.
+
+        The source page and its attachments are fetched concurrently.
+        The destination page is created once they are all downloaded,
+        then the attachments are uploaded concurrently, so only the
+        final page update waits for everything. The first failure is
+        raised as is, rather than wrapped in an exception group.
+        """
+        try:
+            async with asyncio.TaskGroup() as tg:
+                src_page_task = tg.create_task(
+                    self.st.get_page(src_page_id, fmt=PageBodyFormat.Atlas),
+                )
+                src_att_response = await self.st.get_attachments_from_page(
+                    src_page_id,
+                )
+                src_attachments = src_att_response.results
+                downloads = [
+                    tg.create_task(self._download_attachment(att, tempdir))
+                    for att in src_attachments
+                ]
+                page_created_task = tg.create_task(
+                    self._create_dst_page(
+                        src_page_task,
+                        downloads,
+                        space_id,
+                        parent_id,
+                        title=title,
+                    ),
+                )
+                att_tasks = [
+                    tg.create_task(
+                        self._upload_attachment(
+                            att,
+                            tempdir,
+                            download,
+                            page_created_task,
+                        ),
+                    )
+                    for att, download in zip(
+                        src_attachments,
+                        downloads,
+                        strict=True,
+                    )
+                ]
+        except BaseExceptionGroup as group:
+            exc: BaseException = group
+            while isinstance(exc, BaseExceptionGroup):
+                exc = exc.exceptions[0]
+            raise exc from group
+
+        src_page = src_page_task.result()
+        page_created = page_created_task.result()
+        src_body: PageBodyAtlas = cast(PageBodyAtlas, src_page.body)
+        src_content = src_body.atlas_doc_format.content
+
         new_content = src_content
         if len(src_attachments):
-            tasks = []
-            for att in src_attachments:
-                task = self.dt.create_attachment(
-                    str(page_created.id),
-                    tempdir / att.extensions.filename,
-                    comment=self.Comment,
-                    content_type=att.extensions.suffix,
-                    filename=att.title,
-                )
-                tasks.append(task)
-            responses = await asyncio.gather(*tasks)
             mp_att: dict[UUID, PatchMappingValue] = {
                 att_req.extensions.fileId: {
                     "image_id": str(att_resp.first.extensions.fileId),
                     "collection": att_resp.first.extensions.collectionName,
                 }
-                for att_req, att_resp in zip(
+                for att_req, att_task in zip(
                     src_attachments,
-                    responses,
-                    strict=False,
+                    att_tasks,
+                    strict=True,
                 )
-                if att_req.extensions and att_resp.first
+                if (att_resp := att_task.result()) is not None
+                and att_req.extensions
+                and att_resp.first
             }
 
             new_content = {}
@@ -129,52 +205,88 @@ class TransferHelper:
             ),
         )
 
+    async def _get_dst_page_by_title(
+        self,
+        space_id: str,
+        title: str,
+    ) -> PageContent | None:
+        response = await self.dt.get_pages(
+            GetPageParams.model_validate(
+                {"space-id": [int(space_id)], "title": title},
+            ),
+        )
+        return response.first
+
+    async def _create_or_get_dst_page(
+        self,
+        space_id: str,
+        parent_id: str,
+        title: str,
+    ) -> PageContent:
+        try:
+            return await self.dt.create_page(
+                PageCreate(
+                    spaceId=space_id,
+                    status=PageStatusCreate.Current,
+                    title=title,
+                    parentId=parent_id,
+                    body=PageBodyStorageRef(value=""),
+                ),
+            )
+        except ClientError as err:
+            if not (
+                isinstance(err.payload, ResponseError)
+                and err.payload.code == ErrorCode.InvalidRequestParameter
+                and "already exists" in err.payload.title
+            ):
+                raise
+
+        dst_page = await self._get_dst_page_by_title(space_id, title)
+        if dst_page is None:
+            raise RuntimeError(
+                f"Couldn't either create or get page {title}",
+            )
+        return dst_page
+
     async def transfer_ancestors(
         self,
         space_id: str,
         parent_id: str,
         ancestors: list[Ancestor],
     ) -> str:
+        """Recreate the ancestor chain under `parent_id`.
+
+        Source pages and destination existence checks are independent of
+        each other, so they are all fetched concurrently up front.
+        Only the creation of missing pages has to follow the chain order.
+        """
+        page_ancestors = [
+            ancestor
+            for ancestor in ancestors
+            if ancestor.type == AncestorType.Page
+        ]
+        src_pages = await asyncio.gather(
+            *(self.st.get_page(ancestor.id) for ancestor in page_ancestors),
+        )
+        dst_pages = await asyncio.gather(
+            *(
+                self._get_dst_page_by_title(space_id, src_page.title)
+                for src_page in src_pages
+            ),
+        )
+
         current_parent_id: str = parent_id
-        for ancestor in ancestors:
+        for src_page, existing_page in zip(src_pages, dst_pages, strict=True):
             logging.warning(
                 "Creating %s in %s",
-                ancestor.id,
+                src_page.id,
                 current_parent_id,
             )
-            if ancestor.type != AncestorType.Page:
-                continue
-            src_page = await self.st.get_page(ancestor.id)
-            try:
-                dst_page = await self.dt.create_page(
-                    PageCreate(
-                        spaceId=space_id,
-                        status=PageStatusCreate.Current,
-                        title=src_page.title,
-                        parentId=current_parent_id,
-                        body=PageBodyStorageRef(value=""),
-                    ),
-                )
-            except ClientError as err:
-                if not (
-                    isinstance(err.payload, ResponseError)
-                    and err.payload.code == ErrorCode.InvalidRequestParameter
-                    and "already exists" in err.payload.title
-                ):
-                    raise
-                dst_page = None
-
-            if dst_page is None:
-                response = await self.dt.get_pages(
-                    GetPageParams(title=src_page.title),
-                )
-                dst_page = response.first
-
-            if dst_page is None:
-                raise RuntimeError(
-                    "Couldn't either create or get page {src_page.title}",
-                )
-
+            dst_page = existing_page or await self._create_or_get_dst_page(
+                space_id,
+                current_parent_id,
+                src_page.title,
+            )
             current_parent_id = str(dst_page.id)
         return current_parent_id
 
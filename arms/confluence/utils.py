@@ -2,13 +2,12 @@ import asyncio
 import json
 from collections.abc import Coroutine
 from datetime import datetime
+from enum import StrEnum
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Any
 from uuid import UUID
 
-from bs4 import BeautifulSoup
-from bs4.formatter import HTMLFormatter
-
 
 class MyEncoder(json.JSONEncoder):
     def default(self, o: Any) -> str:
@@ -42,20 +41,23 @@ def jsondumps(obj: Any, indent: int = 4) -> str:
     )
 
 
-class Soup(BeautifulSoup):
-    def prettify(
-        self,
-        encoding: str | None = None,
-        formatter: HTMLFormatter | None = None,
-        indent: int = 4,
-    ) -> str:
-        formatter = formatter or HTMLFormatter(indent=indent)
-        return super().prettify(encoding=encoding, formatter=formatter)
-
+class HTMLParser(StrEnum):
+    Builtin = "html.parser"
+    Lxml = "lxml"
 
-def loadhtml(content: str) -> BeautifulSoup:
-    return BeautifulSoup(content, "html.parser")
+    @classmethod
+    def fastest(cls) -> "HTMLParser":
+        return cls.Lxml if find_spec("lxml") else cls.Builtin
 
 
 def run_async(fn: Coroutine[Any, Any, Any]) -> None:
     return asyncio.run(fn)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the BeautifulSoup helpers only once they are requested."""
+    if name in {"Soup", "loadhtml"}:
+        from . import soup
+
+        return getattr(soup, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
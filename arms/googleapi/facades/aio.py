@@ -0,0 +1,419 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Literal, ParamSpec, Self, TypeVar
+
+from .drive import GoogleDrive, googledrive
+from .sheets import GoogleSheet, googlesheet
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+    from concurrent.futures import Executor
+    from pathlib import Path
+    from types import TracebackType
+
+    from googleapiclient._apis.drive.v3.schemas import File, Permission
+    from googleapiclient._apis.sheets.v4.schemas import (
+        BatchUpdateSpreadsheetResponse,
+        ClearValuesResponse,
+        UpdateValuesResponse,
+    )
+
+    from ..typedefs import SheetsData, ValueInputOption, ValueRenderOption
+    from .drive import (
+        DiffObj,
+        DownloadOptions,
+        DownloadProgress,
+        ProgressCallback,
+        SyncDirection,
+        UploadProgressCallback,
+    )
+    from .sheets import Book
+
+ParamsType = ParamSpec("ParamsType")
+ReturnType = TypeVar("ReturnType")
+
+
+class AsyncExecutor:
+    """Run blocking facade calls in a thread pool from an event loop.
+
+    The service factory hands out one service per thread, so calls
+    running in different workers never share a connection. An executor can be
+    passed to share its workers between facades, it is then left open
+    by `close`.
+    """
+
+    DefaultMaxWorkers: int = GoogleDrive.DefaultMaxWorkers
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        max_workers: int = DefaultMaxWorkers,
+    ) -> None:
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=self.__class__.__name__,
+        )
+
+    async def run(
+        self,
+        func: Callable[ParamsType, ReturnType],
+        *args: ParamsType.args,
+        **kwargs: ParamsType.kwargs,
+    ) -> ReturnType:
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            partial(func, *args, **kwargs),
+        )
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+class AsyncGoogleDrive(AsyncExecutor):
+    """Asynchronous counterpart of `GoogleDrive`.
+
+    Operations spawning their own workers, like `download_folder`,
+    occupy a single worker of the executor while they run.
+    """
+
+    def __init__(
+        self,
+        drive: GoogleDrive = googledrive,
+        executor: Executor | None = None,
+        max_workers: int = AsyncExecutor.DefaultMaxWorkers,
+    ) -> None:
+        super().__init__(executor, max_workers)
+        self.drive = drive
+
+    async def grant_permissions(
+        self,
+        file_id: str,
+        perm_obj: Permission,
+    ) -> Permission:
+        return await self.run(self.drive.grant_permissions, file_id, perm_obj)
+
+    async def grant_permissions_many(
+        self,
+        file_ids: Sequence[str],
+        perm_obj: Permission,
+    ) -> dict[str, Permission]:
+        return await self.run(
+            self.drive.grant_permissions_many,
+            file_ids,
+            perm_obj,
+        )
+
+    async def delete_file(self, file_id: str) -> str:
+        return await self.run(self.drive.delete_file, file_id)
+
+    async def delete_many(self, file_ids: Sequence[str]) -> dict[str, str]:
+        return await self.run(self.drive.delete_many, file_ids)
+
+    async def get_metadata(
+        self,
+        file_id: str,
+        fields: list[str] | None = None,
+    ) -> File:
+        return await self.run(self.drive.get_metadata, file_id, fields)
+
+    async def get_metadata_many(
+        self,
+        file_ids: Sequence[str],
+        fields: list[str] | None = None,
+    ) -> dict[str, File]:
+        return await self.run(self.drive.get_metadata_many, file_ids, fields)
+
+    async def list_folder(
+        self,
+        folder_id: str,
+        fields: list[str] | None = None,
+        page_size: int = GoogleDrive.MaxPageSize,
+        *,
+        refresh: bool = False,
+        drive_id: str | None = None,
+    ) -> list[File]:
+        return await self.run(
+            self.drive.list_folder,
+            folder_id,
+            fields,
+            page_size,
+            refresh=refresh,
+            drive_id=drive_id,
+        )
+
+    async def crawl_remote(
+        self,
+        folder_id: str,
+        should_descend: Callable[[Path], bool] | None = None,
+        max_workers: int = GoogleDrive.DefaultMaxWorkers,
+        *,
+        refresh: bool = False,
+        drive_id: str | None = None,
+    ) -> dict[Path, File]:
+        """See `GoogleDrive.crawl_remote`.
+
+        `should_descend` is still called from the worker threads.
+        """
+        return await self.run(
+            self.drive.crawl_remote,
+            folder_id,
+            should_descend,
+            max_workers,
+            refresh=refresh,
+            drive_id=drive_id,
+        )
+
+    async def build_index(
+        self,
+        folder_id: str,
+        max_workers: int = GoogleDrive.DefaultMaxWorkers,
+    ) -> int:
+        return await self.run(self.drive.build_index, folder_id, max_workers)
+
+    async def resolve_path(self, folder_id: str, relpath: Path) -> File | None:
+        return await self.run(self.drive.resolve_path, folder_id, relpath)
+
+    async def download_file(
+        self,
+        file: File,
+        path: Path | None = None,
+        options: DownloadOptions | None = None,
+    ) -> None:
+        return await self.run(self.drive.download_file, file, path, options)
+
+    async def download_file_by_id(
+        self,
+        file_id: str,
+        path: Path | None = None,
+        options: DownloadOptions | None = None,
+        *,
+        refresh: bool = False,
+    ) -> None:
+        return await self.run(
+            self.drive.download_file_by_id,
+            file_id,
+            path,
+            options,
+            refresh=refresh,
+        )
+
+    async def download_folder(
+        self,
+        folder_id: str,
+        path: Path | None = None,
+        name: str | None = None,
+        options: DownloadOptions | None = None,
+        max_workers: int = GoogleDrive.DefaultMaxWorkers,
+        on_progress: ProgressCallback | None = None,
+        *,
+        refresh: bool = False,
+    ) -> DownloadProgress:
+        """See `GoogleDrive.download_folder`.
+
+        `on_progress` is still called from the worker threads.
+        """
+        return await self.run(
+            self.drive.download_folder,
+            folder_id,
+            path,
+            name,
+            options,
+            max_workers,
+            on_progress,
+            refresh=refresh,
+        )
+
+    async def upload_file_to_folder(
+        self,
+        filepath: Path,
+        folder_id: str,
+        *,
+        resumable: bool | None = None,
+    ) -> File:
+        return await self.run(
+            self.drive.upload_file_to_folder,
+            filepath,
+            folder_id,
+            resumable=resumable,
+        )
+
+    async def upload_many(
+        self,
+        filepaths: Iterable[Path],
+        folder_id: str,
+        max_workers: int = GoogleDrive.DefaultMaxWorkers,
+        on_progress: UploadProgressCallback | None = None,
+    ) -> dict[Path, File]:
+        return await self.run(
+            self.drive.upload_many,
+            filepaths,
+            folder_id,
+            max_workers,
+            on_progress,
+        )
+
+    async def create_remote_folder(self, name: str, parent_id: str) -> File:
+        return await self.run(self.drive.create_remote_folder, name, parent_id)
+
+    async def update_file(self, file_id: str, filepath: Path) -> File:
+        return await self.run(self.drive.update_file, file_id, filepath)
+
+    async def compare_folders(
+        self,
+        path: Path,
+        folder_id: str,
+        max_workers: int = GoogleDrive.DefaultMaxWorkers,
+        hash_workers: int | None = None,
+        *,
+        refresh: bool = False,
+    ) -> Sequence[DiffObj]:
+        return await self.run(
+            self.drive.compare_folders,
+            path,
+            folder_id,
+            max_workers,
+            hash_workers,
+            refresh=refresh,
+        )
+
+    async def sync(
+        self,
+        path: Path,
+        folder_id: str,
+        direction: SyncDirection = "both",
+        *,
+        dry_run: bool = False,
+        max_workers: int = GoogleDrive.DefaultMaxWorkers,
+        hash_workers: int | None = None,
+        refresh: bool = False,
+    ) -> list[DiffObj]:
+        return await self.run(
+            self.drive.sync,
+            path,
+            folder_id,
+            direction,
+            dry_run=dry_run,
+            max_workers=max_workers,
+            hash_workers=hash_workers,
+            refresh=refresh,
+        )
+
+
+class AsyncGoogleSheet(AsyncExecutor):
+    """Asynchronous counterpart of `GoogleSheet`.
+
+    The books it returns are synchronous, their operations are offered
+    here by book ID.
+    """
+
+    def __init__(
+        self,
+        sheet: GoogleSheet = googlesheet,
+        executor: Executor | None = None,
+        max_workers: int = AsyncExecutor.DefaultMaxWorkers,
+    ) -> None:
+        super().__init__(executor, max_workers)
+        self.sheet = sheet
+
+    async def book(self, book_id: str | None = None) -> Book:
+        return await self.run(self.sheet.book, book_id)
+
+    async def update_values(
+        self,
+        book_id: str,
+        data: SheetsData,
+        range_: str = "A1",
+        option: Literal[
+            "INPUT_VALUE_OPTION_UNSPECIFIED",
+            "RAW",
+            "USER_ENTERED",
+        ] = "USER_ENTERED",
+    ) -> UpdateValuesResponse:
+        return await self.run(
+            self.sheet.update_values,
+            book_id,
+            data,
+            range_,
+            option=option,
+        )
+
+    async def write_rows(
+        self,
+        book_id: str,
+        rows: Iterable[Sequence[str]],
+        range_: str = "A1",
+        option: ValueInputOption = "USER_ENTERED",
+        max_workers: int = 1,
+    ) -> list[UpdateValuesResponse]:
+        """See `GoogleSheet.write_rows`.
+
+        `rows` is consumed from a worker thread.
+        """
+        return await self.run(
+            self.sheet.write_rows,
+            book_id,
+            rows,
+            range_,
+            option=option,
+            max_workers=max_workers,
+        )
+
+    async def get_values(
+        self,
+        book_id: str,
+        range_: str,
+        render_option: ValueRenderOption = "FORMATTED_VALUE",
+    ) -> list[list[Any]]:
+        return await self.run(
+            self.sheet.get_values,
+            book_id,
+            range_,
+            render_option,
+        )
+
+    async def read_many(
+        self,
+        book_id: str,
+        ranges: Sequence[str],
+        render_option: ValueRenderOption = "FORMATTED_VALUE",
+    ) -> list[Iterator[list[Any]]]:
+        return await self.run(
+            self.sheet.read_many,
+            book_id,
+            ranges,
+            render_option,
+        )
+
+    async def update_currency_format(
+        self,
+        book_id: str,
+        range_: str,
+    ) -> BatchUpdateSpreadsheetResponse:
+        return await self.run(
+            self.sheet.update_currency_format,
+            book_id,
+            range_,
+        )
+
+    async def clear_values(
+        self,
+        book_id: str,
+        range_: str = "A1:ZZ",
+    ) -> ClearValuesResponse:
+        return await self.run(self.sheet.clear_values, book_id, range_)
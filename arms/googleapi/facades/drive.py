@@ -1,12 +1,19 @@
 from __future__ import annotations
 
-import hashlib
 import json
 import logging
 import os
 import shutil
-from io import BytesIO
+import threading
+from collections import deque
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    as_completed,
+)
+from datetime import datetime
+from functools import partial
 from pathlib import Path
+from stat import S_ISDIR, S_ISREG
 from typing import (
     TYPE_CHECKING,
     Annotated,
@@ -15,36 +22,58 @@ from typing import (
     Literal,
     NotRequired,
     TypedDict,
+    TypeVar,
     cast,
 )
-
-from googleapiclient.errors import HttpError
+from uuid import uuid4
 
 from ..helpers.drive import DriveHelper, default_drive_helper
+from ..helpers.hashing import HashCache, md5
 from ..payloads.enums import MimeType
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Sequence
+    from collections.abc import Callable, Generator, Iterable, Sequence
+    from concurrent.futures import Future
 
     from googleapiclient._apis.drive.v3.schemas import File, Permission
+    from googleapiclient.errors import HttpError
 
-
-def md5(filepath: Path) -> str:
-    hash_md5 = hashlib.md5()  # noqa: S324
-    with filepath.open("rb") as readfile:
-        for chunk in iter(lambda: readfile.read(4096), b""):
-            hash_md5.update(chunk)
-    return hash_md5.hexdigest()
+    from ..helpers.index import RemoteIndex
 
 
 class OperationalError(Exception): ...
 
 
+class BatchError(OperationalError):
+    """Some batched calls failed, even after retrying.
+
+    Carries the errors and the results of the successful calls,
+    both keyed by file ID.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        failed: dict[str, HttpError],
+        succeeded: dict[str, Any],
+    ) -> None:
+        super().__init__(message, failed)
+        self.failed = failed
+        self.succeeded = succeeded
+
+
+BatchResultType = TypeVar("BatchResultType")
+
+
 class DiffObj(TypedDict):
     side: Literal["local", "remote", "both"]
     path: str
     type: NotRequired[Literal["file", "folder"]]
     comment: NotRequired[str]
+    file: NotRequired[File]
+    parent_id: NotRequired[
+        Annotated[str, "ID of the remote folder containing the diff"]
+    ]
 
 
 class DownloadOptions(TypedDict):
@@ -57,6 +86,24 @@ class DownloadOptions(TypedDict):
 DefaultDownloadOptions = DownloadOptions(ignore_existing=True)
 
 
+class DownloadProgress(TypedDict):
+    folders: int
+    files: int
+    done: int
+    failed: int
+
+
+class UploadProgress(TypedDict):
+    files: int
+    done: int
+    failed: int
+
+
+type ProgressCallback = Callable[[DownloadProgress], None]
+type UploadProgressCallback = Callable[[UploadProgress], None]
+type SyncDirection = Literal["upload", "download", "both"]
+
+
 class GoogleDrive:
     DefaultFieldsFile: ClassVar[list[str]] = [
         "kind",
@@ -65,13 +112,29 @@ class GoogleDrive:
         "mimeType",
         "size",
         "md5Checksum",
+        "modifiedTime",
     ]
-    DefaultFieldsListFolder: str = (
-        f"nextPageToken, files({', '.join(DefaultFieldsFile)})"
-    )
+    DefaultFieldsGet: str = ", ".join(DefaultFieldsFile)
+    DefaultFieldsListFolder: str = f"nextPageToken, files({DefaultFieldsGet})"
+    MaxPageSize: int = 1000
+    DownloadChunkSize: int = 16 * 1024 * 1024
+    DefaultMaxWorkers: int = 8
+    # https://developers.google.com/drive/api/guides/manage-uploads
+    ResumableThreshold: int = 5 * 1024 * 1024
+    UploadChunkSize: int = 8 * 1024 * 1024
+    NumRetries: int = 5
 
-    def __init__(self, helper: DriveHelper) -> None:
+    def __init__(
+        self,
+        helper: DriveHelper,
+        chunk_size: int = DownloadChunkSize,
+        hash_cache: HashCache | None = None,
+        remote_index: RemoteIndex | None = None,
+    ) -> None:
         self.helper = helper
+        self.chunk_size = chunk_size
+        self.hash_cache = hash_cache
+        self.remote_index = remote_index
         self.logger = logging.getLogger(
             f"{__name__}.{self.__class__.__name__}",
         )
@@ -84,7 +147,59 @@ class GoogleDrive:
         return self.helper.grant_permissions(file_id, perm_obj)
 
     def delete_file(self, file_id: str) -> str:
-        return self.helper.delete_file(file_id)
+        response = self.helper.delete_file(file_id)
+        if self.remote_index is not None:
+            self.remote_index.remove(file_id)
+        return response
+
+    @staticmethod
+    def _collect_batch(
+        file_ids: Sequence[str],
+        results: Sequence[BatchResultType | HttpError],
+    ) -> dict[str, BatchResultType]:
+        from googleapiclient.errors import HttpError
+
+        failed: dict[str, HttpError] = {}
+        succeeded: dict[str, BatchResultType] = {}
+        for file_id, result in zip(file_ids, results, strict=True):
+            if isinstance(result, HttpError):
+                failed[file_id] = result
+            else:
+                succeeded[file_id] = result
+        if failed:
+            raise BatchError(
+                f"{len(failed)}/{len(file_ids)} batched calls failed",
+                failed,
+                succeeded,
+            )
+        return succeeded
+
+    def grant_permissions_many(
+        self,
+        file_ids: Sequence[str],
+        perm_obj: Permission,
+    ) -> dict[str, Permission]:
+        return self._collect_batch(
+            file_ids,
+            self.helper.grant_permissions_many(
+                file_ids,
+                perm_obj,
+                num_retries=self.NumRetries,
+            ),
+        )
+
+    def delete_many(self, file_ids: Sequence[str]) -> dict[str, str]:
+        from googleapiclient.errors import HttpError
+
+        results = self.helper.delete_many(
+            file_ids,
+            num_retries=self.NumRetries,
+        )
+        if self.remote_index is not None:
+            for file_id, result in zip(file_ids, results, strict=True):
+                if not isinstance(result, HttpError):
+                    self.remote_index.remove(file_id)
+        return self._collect_batch(file_ids, results)
 
     def get_metadata(
         self,
@@ -98,6 +213,26 @@ class GoogleDrive:
         )
         return self.helper.get_metadata(file_id, fields=fields_str)
 
+    def get_metadata_many(
+        self,
+        file_ids: Sequence[str],
+        fields: list[str] | None = None,
+    ) -> dict[str, File]:
+        """Get metadata of many files, batching up to 100 calls per request.
+
+        Rate limited calls are retried up to `NumRetries` times. Raises
+        `BatchError` with the failed and successful calls, keyed by
+        file ID.
+        """
+        return self._collect_batch(
+            file_ids,
+            self.helper.get_metadata_many(
+                file_ids,
+                fields=", ".join(fields) if fields else "*",
+                num_retries=self.NumRetries,
+            ),
+        )
+
     def dump_metadata(
         self,
         file_id: str,
@@ -121,26 +256,77 @@ class GoogleDrive:
     def is_remote_folder(file: File) -> bool:
         return file.get("mimeType") == MimeType.GoogleAppsFolder
 
-    def list_folder(
+    def iter_folder(
         self,
         folder_id: str,
         fields: list[str] | None = None,
-        page_size: int = 100,
-    ) -> list[File]:
+        page_size: int = MaxPageSize,
+        *,
+        refresh: bool = False,
+        drive_id: str | None = None,
+    ) -> Generator[File, Any, None]:
+        """Yield the children of a folder, following `nextPageToken`.
+
+        With the default fields, listings are served from and stored in
+        the remote index if any, unless `refresh` is set. Folders of a
+        shared drive are listed with its `drive_id`.
+        """
+        index = None if fields else self.remote_index
+        if (
+            index is not None
+            and not refresh
+            and (children := index.children(folder_id)) is not None
+        ):
+            yield from children
+            return
+
         fields_str: str = (
             f"nextPageToken, files({', '.join(fields)})"
             if fields and len(fields) > 0
             else self.DefaultFieldsListFolder
         )
-        try:
-            response = self.helper.list_folder(
+        from googleapiclient.errors import HttpError
+
+        listing: list[File] = []
+        page_token: str | None = None
+        while True:
+            try:
+                response = self.helper.list_folder(
+                    folder_id,
+                    fields_str,
+                    page_size,
+                    page_token=page_token,
+                    drive_id=drive_id,
+                )
+            except HttpError as http_err:
+                raise OperationalError(http_err) from http_err
+            files = response.get("files", [])
+            if index is not None:
+                listing.extend(files)
+            yield from files
+            if not (page_token := response.get("nextPageToken")):
+                break
+        if index is not None:
+            index.put_listing(folder_id, listing)
+
+    def list_folder(
+        self,
+        folder_id: str,
+        fields: list[str] | None = None,
+        page_size: int = MaxPageSize,
+        *,
+        refresh: bool = False,
+        drive_id: str | None = None,
+    ) -> list[File]:
+        return list(
+            self.iter_folder(
                 folder_id,
-                fields_str,
+                fields,
                 page_size,
-            )
-            return response["files"]
-        except HttpError as http_err:
-            raise OperationalError(http_err) from http_err
+                refresh=refresh,
+                drive_id=drive_id,
+            ),
+        )
 
     def create_empty_file(self, path: Path, name: str) -> None:
         filepath = path / name
@@ -150,8 +336,15 @@ class GoogleDrive:
             filepath.unlink()
         filepath.open("wb").close()
 
+    def get_indexed(self, file_id: str) -> File | None:
+        if self.remote_index is None:
+            return None
+        return self.remote_index.get(file_id)
+
     def get_filename_from_metadata(self, file_id: str) -> str:
-        metadata = self.helper.get_metadata(file_id)
+        metadata = self.get_indexed(file_id) or self.helper.get_metadata(
+            file_id,
+        )
         if not metadata or not metadata.get("name"):
             raise ValueError("file name unspecified")
         return metadata["name"]
@@ -162,12 +355,23 @@ class GoogleDrive:
         path: Path,
         name: str | None = None,
     ) -> None:
+        """Stream a file to disk, then move it in place atomically.
+
+        Memory usage is bounded by the chunk size whatever the file size.
+        """
         filename = name or self.get_filename_from_metadata(file_id)
-        with BytesIO() as buffer:
-            self.helper.download_file(file_id, buffer)
-            filepath = path / filename
-            with filepath.open("wb") as writefile:
-                writefile.write(buffer.getvalue())
+        filepath = path / filename
+        partpath = path / f".{filename}.{uuid4().hex}.part"
+        try:
+            with partpath.open("xb") as writefile:
+                self.helper.download_file(
+                    file_id,
+                    writefile,
+                    chunk_size=self.chunk_size,
+                )
+            partpath.replace(filepath)
+        finally:
+            partpath.unlink(missing_ok=True)
 
     def download_file(
         self,
@@ -190,7 +394,7 @@ class GoogleDrive:
         if filepath.is_file():
             if options.get("ignore_existing", True):
                 return None
-            dst_md5 = md5(filepath)
+            dst_md5 = self.local_md5(filepath)
             if dst_md5 == src_md5:
                 self.logger.info("File <%s>: MD5 match", filename)
                 return None
@@ -207,9 +411,16 @@ class GoogleDrive:
         file_id: str,
         path: Path | None = None,
         options: DownloadOptions | None = None,
+        *,
+        refresh: bool = False,
     ) -> None:
+        """Download a file, its metadata fetched unless indexed.
+
+        `refresh` bypasses the remote index, see `iter_folder`.
+        """
+        indexed = None if refresh else self.get_indexed(file_id)
         return self.download_file(
-            self.get_metadata(file_id),
+            indexed or self.get_metadata(file_id),
             path=path,
             options=options,
         )
@@ -234,37 +445,73 @@ class GoogleDrive:
         path: Path | None = None,
         name: str | None = None,
         options: DownloadOptions | None = None,
-    ) -> None:
+        max_workers: int = DefaultMaxWorkers,
+        on_progress: ProgressCallback | None = None,
+        *,
+        refresh: bool = False,
+    ) -> DownloadProgress:
+        """Download a folder recursively.
+
+        Folders are listed breadth-first and their files are downloaded
+        by a pool of `max_workers` threads, each with its own service.
+        `on_progress` is called from the worker threads after each file.
+        `refresh` bypasses the remote index, see `iter_folder`.
+        """
         options = options or DefaultDownloadOptions
         folder_name = name or self.get_filename_from_metadata(folder_id)
-        folder_path = (path or Path()) / folder_name
-
-        self.logger.info("Downloading folder %s...", folder_name)
-        self.create_folder(folder_path)
-
-        files: list[File] = self.list_folder(folder_id)
-        total: int = len(files)
-        for idx, file in enumerate(files):
-            filename = file["name"]
-            mimetype = file["mimeType"]
-            if mimetype == MimeType.GoogleAppsFolder:
-                folder_id = file["id"]
-                self.download_folder(
-                    folder_id,
-                    folder_path,
-                    filename,
-                    options=options,
-                )
-            elif self.is_downloadable(mimetype):
-                self.download_file(file, path=folder_path, options=options)
-            else:
-                self.logger.warning("Undownloadable: %s", file)
+        progress = DownloadProgress(folders=0, files=0, done=0, failed=0)
+        lock = threading.Lock()
+        slots = threading.BoundedSemaphore(max_workers * 2)
+
+        def on_done(file: File, future: Future[None]) -> None:
+            slots.release()
+            with lock:
+                if (exc := future.exception()) is not None:
+                    progress["failed"] += 1
+                    self.logger.error("Failed to download %s: %s", file, exc)
+                else:
+                    progress["done"] += 1
+                snapshot = progress.copy()
             self.logger.info(
-                "[%s] Processed %d/%d",
-                folder_path,
-                idx,
-                total,
+                "Downloaded %d/%d files",
+                snapshot["done"],
+                snapshot["files"],
             )
+            if on_progress:
+                on_progress(snapshot)
+
+        queue = deque([(folder_id, (path or Path()) / folder_name)])
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while queue:
+                current_id, current_path = queue.popleft()
+                self.logger.info("Downloading folder %s...", current_path)
+                self.create_folder(current_path)
+                with lock:
+                    progress["folders"] += 1
+
+                for file in self.iter_folder(current_id, refresh=refresh):
+                    mimetype = file["mimeType"]
+                    if mimetype == MimeType.GoogleAppsFolder:
+                        queue.append((file["id"], current_path / file["name"]))
+                    elif self.is_downloadable(mimetype):
+                        slots.acquire()
+                        with lock:
+                            progress["files"] += 1
+                        executor.submit(
+                            self.download_file,
+                            file,
+                            path=current_path,
+                            options=options,
+                        ).add_done_callback(partial(on_done, file))
+                    else:
+                        self.logger.warning("Undownloadable: %s", file)
+
+        if progress["failed"]:
+            raise OperationalError(
+                f"{progress['failed']}/{progress['files']} files "
+                "failed to download",
+            )
+        return progress
 
     def mkdiff(
         self,
@@ -272,86 +519,569 @@ class GoogleDrive:
         path: Path,
         type_: Literal["file", "folder"] | None = None,
         comment: str | None = None,
+        file: File | None = None,
+        parent_id: str | None = None,
     ) -> DiffObj:
         diff = {
             "side": side,
             "path": str(path),
             "type": type_,
             "comment": comment,
+            "file": file,
+            "parent_id": parent_id,
         }
         return cast(DiffObj, {key: val for key, val in diff.items() if val})
 
+    def local_md5(self, path: Path) -> str:
+        if self.hash_cache is None:
+            return md5(path)
+        return self.hash_cache.md5(path)
+
+    def compare_files(self, path: Path, remote_file: File) -> bool:
+        return self.local_md5(path) == remote_file["md5Checksum"]
+
     @staticmethod
-    def compare_files(path: Path, remote_file: File) -> bool:
-        return md5(path) == remote_file["md5Checksum"]
+    def scan_local(
+        path: Path,
+        should_descend: Callable[[Path], bool] | None = None,
+    ) -> dict[Path, os.stat_result]:
+        """Stat every entry under `path`, keyed by their relative path.
+
+        `os.scandir` is used so that the stat results can be reused.
+        Only the subfolders accepted by `should_descend` are walked.
+        Broken symlinks are skipped, and symlinks to folders are kept
+        unresolved so that a link to an ancestor cannot loop.
+        """
+        entries: dict[Path, os.stat_result] = {}
+        stack: list[Path] = [Path()]
+        while stack:
+            relpath = stack.pop()
+            with os.scandir(path / relpath) as iterator:
+                for entry in iterator:
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    if S_ISDIR(stat.st_mode) and entry.is_symlink():
+                        stat = entry.stat(follow_symlinks=False)
+                    child_path = relpath / entry.name
+                    entries[child_path] = stat
+                    if S_ISDIR(stat.st_mode) and (
+                        should_descend is None or should_descend(child_path)
+                    ):
+                        stack.append(child_path)
+        return entries
+
+    def crawl_remote(
+        self,
+        folder_id: str,
+        should_descend: Callable[[Path], bool] | None = None,
+        max_workers: int = DefaultMaxWorkers,
+        *,
+        refresh: bool = False,
+        drive_id: str | None = None,
+    ) -> dict[Path, File]:
+        """List a remote tree, keyed by relative path.
+
+        The tree is crawled level by level, the folders of each level
+        being listed concurrently. Only the subfolders accepted by
+        `should_descend` are crawled. Indexed listings are reused
+        unless `refresh` is set. See `iter_folder` for `drive_id`.
+        """
+        entries: dict[Path, File] = {}
+        level: list[tuple[str, Path]] = [(folder_id, Path())]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while level:
+                listings = executor.map(
+                    lambda item: self.list_folder(
+                        item[0],
+                        refresh=refresh,
+                        drive_id=drive_id,
+                    ),
+                    level,
+                )
+                next_level: list[tuple[str, Path]] = []
+                for (_, relpath), children in zip(
+                    level,
+                    listings,
+                    strict=True,
+                ):
+                    for child in children:
+                        child_path = relpath / child["name"]
+                        entries[child_path] = child
+                        if not self.is_remote_folder(child):
+                            continue
+                        if should_descend is None or should_descend(
+                            child_path,
+                        ):
+                            next_level.append((child["id"], child_path))
+                level = next_level
+        return entries
+
+    def build_index(
+        self,
+        folder_id: str,
+        max_workers: int = DefaultMaxWorkers,
+    ) -> int:
+        """Crawl a whole remote tree into the remote index.
+
+        Returns the number of indexed files and folders.
+        """
+        if self.remote_index is None:
+            raise ValueError("no remote index configured")
+        return len(
+            self.crawl_remote(
+                folder_id,
+                max_workers=max_workers,
+                refresh=True,
+            ),
+        )
+
+    def resolve_path(self, folder_id: str, relpath: Path) -> File | None:
+        """Find a file by its path relative to a folder.
+
+        Each folder along the path is listed once, then indexed.
+        """
+        file: File | None = None
+        for name in relpath.parts:
+            file = next(
+                (
+                    child
+                    for child in self.list_folder(folder_id)
+                    if child["name"] == name
+                ),
+                None,
+            )
+            if file is None:
+                return None
+            folder_id = file["id"]
+        return file
+
+    def local_md5_many(
+        self,
+        files: dict[Path, os.stat_result],
+        max_workers: int | None = None,
+    ) -> dict[Path, str]:
+        """Hash many local files, in a thread pool for those not cached.
+
+        hashlib releases the GIL while hashing large buffers, so threads
+        hash files in parallel without the startup cost of processes.
+        """
+        digests: dict[Path, str] = {}
+        if self.hash_cache is not None:
+            for path, stat in files.items():
+                if (digest := self.hash_cache.get(path, stat)) is not None:
+                    digests[path] = digest
+
+        missing = [path for path in files if path not in digests]
+        if len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                hashed = dict(
+                    zip(missing, executor.map(md5, missing), strict=True),
+                )
+        else:
+            hashed = {path: md5(path) for path in missing}
+
+        if self.hash_cache is not None:
+            for path, digest in hashed.items():
+                self.hash_cache.put(path, files[path], digest)
+        return digests | hashed
 
     def _compare_folders(  # noqa: PLR0912
         self,
         path: Path,
         folder_id: str,
         remote_path: Path | None = None,
+        max_workers: int = DefaultMaxWorkers,
+        hash_workers: int | None = None,
+        *,
+        refresh: bool = False,
     ) -> Generator[DiffObj, Any, Any]:
+        """Diff a local tree against a remote one from their snapshots.
+
+        Folders present on a single side, or being a file on the other,
+        are reported without their content. The remote snapshot is read
+        from the remote index if any, unless `refresh` is set.
+        """
         if not path.exists():
             raise ValueError(f"local path does not exist: {path}")
 
-        if len(children := os.listdir(path)) == 0:
+        if not any(path.iterdir()):
             raise ValueError(f"local path {path} is empty")
 
-        if (remote_children := self.list_folder(folder_id)) is None:
-            raise ValueError(f"remote path does not exist: {remote_path}")
+        remote = self.crawl_remote(
+            folder_id,
+            should_descend=lambda relpath: (
+                (path / relpath).is_dir() and not (path / relpath).is_symlink()
+            ),
+            max_workers=max_workers,
+            refresh=refresh,
+        )
+        compared: dict[Path, str] = {Path(): folder_id} | {
+            relpath: file["id"]
+            for relpath, file in remote.items()
+            if self.is_remote_folder(file)
+        }
+        local = self.scan_local(path, should_descend=compared.__contains__)
+        compared = {
+            relpath: file_id
+            for relpath, file_id in compared.items()
+            if relpath == Path()
+            or (relpath in local and S_ISDIR(local[relpath].st_mode))
+        }
 
-        mp_remote_name: dict[str, File] = {
-            file["name"]: file for file in remote_children
+        candidates = {
+            path / relpath: stat
+            for relpath, stat in local.items()
+            if relpath.parent in compared
+            and S_ISREG(stat.st_mode)
+            and relpath in remote
+            and int(remote[relpath].get("size", -1)) == stat.st_size
         }
-        for filename in children:
-            local_child_path = path / filename
-            remote_child_path = (remote_path or Path()) / filename
-            if local_child_path.is_dir():
-                if filename not in mp_remote_name:
-                    yield self.mkdiff(
-                        "local",
-                        local_child_path,
-                        type_="folder",
-                    )
-                    continue
-                if not self.is_remote_folder(mp_remote_name[filename]):
-                    yield self.mkdiff("both", local_child_path)
-                    continue
-                yield from self._compare_folders(
-                    local_child_path,
-                    mp_remote_name[filename]["id"],
-                    remote_child_path,
-                )
+        digests = self.local_md5_many(candidates, max_workers=hash_workers)
+
+        for relpath, stat in sorted(local.items()):
+            if relpath.parent not in compared:
                 continue
-            elif local_child_path.is_file():
-                if filename not in mp_remote_name:
-                    yield self.mkdiff("local", local_child_path, type_="file")
-                    continue
-                if self.is_remote_folder(mp_remote_name[filename]):
-                    yield self.mkdiff("both", local_child_path)
-                    continue
-                if not self.compare_files(
-                    local_child_path,
-                    mp_remote_name[filename],
-                ):
-                    yield self.mkdiff("both", local_child_path, type_="file")
-                    continue
+            local_child_path = path / relpath
+            remote_file = remote.get(relpath)
+            mkdiff = partial(
+                self.mkdiff,
+                path=local_child_path,
+                file=remote_file,
+                parent_id=compared[relpath.parent],
+            )
+            if S_ISDIR(stat.st_mode):
+                if remote_file is None:
+                    yield mkdiff("local", type_="folder")
+                elif not self.is_remote_folder(remote_file):
+                    yield mkdiff("both")
+            elif S_ISREG(stat.st_mode):
+                if remote_file is None:
+                    yield mkdiff("local", type_="file")
+                elif self.is_remote_folder(remote_file):
+                    yield mkdiff("both")
+                elif (
+                    remote_md5 := remote_file.get("md5Checksum")
+                ) is None or digests.get(local_child_path) != remote_md5:
+                    # native Google files have no checksum to compare
+                    yield mkdiff("both", type_="file")
 
-        for filename in mp_remote_name:
-            if filename not in children:
-                remote_child_path = (remote_path or Path()) / filename
-                yield self.mkdiff("remote", remote_child_path)
+        for relpath, remote_file in sorted(remote.items()):
+            if relpath.parent in compared and relpath not in local:
+                yield self.mkdiff(
+                    "remote",
+                    (remote_path or Path()) / relpath,
+                    type_=(
+                        "folder"
+                        if self.is_remote_folder(remote_file)
+                        else "file"
+                    ),
+                    file=remote_file,
+                    parent_id=compared[relpath.parent],
+                )
 
-    def compare_folders(self, path: Path, folder_id: str) -> Sequence[DiffObj]:
-        return list(self._compare_folders(path, folder_id) or [])
+    def compare_folders(
+        self,
+        path: Path,
+        folder_id: str,
+        max_workers: int = DefaultMaxWorkers,
+        hash_workers: int | None = None,
+        *,
+        refresh: bool = False,
+    ) -> Sequence[DiffObj]:
+        return list(
+            self._compare_folders(
+                path,
+                folder_id,
+                max_workers=max_workers,
+                hash_workers=hash_workers,
+                refresh=refresh,
+            ),
+        )
 
     def upload_file_to_folder(
         self,
         filepath: Path,
         folder_id: str,
+        *,
+        resumable: bool | None = None,
     ) -> File:
+        """Upload a file, by resumable chunks if it is large.
+
+        Resumable uploads are used above `ResumableThreshold` by default,
+        their chunks are retried on transient errors.
+        """
         # https://github.com/googleworkspace/python-samples/blob/main/drive/snippets/drive-v3/file_snippet/upload_to_folder.py
-        return self.helper.upload_file_to_folder(filepath, folder_id)
+        if resumable is None:
+            resumable = filepath.stat().st_size > self.ResumableThreshold
+        return self.index(
+            self.helper.upload_file_to_folder(
+                filepath,
+                folder_id,
+                resumable=resumable,
+                chunk_size=self.UploadChunkSize,
+                num_retries=self.NumRetries,
+                fields=self.DefaultFieldsGet,
+            ),
+            folder_id,
+        )
+
+    def upload_many(
+        self,
+        filepaths: Iterable[Path],
+        folder_id: str,
+        max_workers: int = DefaultMaxWorkers,
+        on_progress: UploadProgressCallback | None = None,
+    ) -> dict[Path, File]:
+        """Upload files to a folder with `max_workers` concurrent uploads.
+
+        `on_progress` is called from the worker threads after each file.
+        """
+        progress = UploadProgress(files=0, done=0, failed=0)
+        uploaded: dict[Path, File] = {}
+        lock = threading.Lock()
+
+        def on_done(filepath: Path, future: Future[File]) -> None:
+            with lock:
+                if (exc := future.exception()) is not None:
+                    progress["failed"] += 1
+                    self.logger.error("Failed to upload %s: %s", filepath, exc)
+                else:
+                    progress["done"] += 1
+                    uploaded[filepath] = future.result()
+                snapshot = progress.copy()
+            if on_progress:
+                on_progress(snapshot)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for filepath in filepaths:
+                with lock:
+                    progress["files"] += 1
+                executor.submit(
+                    self.upload_file_to_folder,
+                    filepath,
+                    folder_id,
+                ).add_done_callback(partial(on_done, filepath))
+
+        if progress["failed"]:
+            raise OperationalError(
+                f"{progress['failed']}/{progress['files']} files "
+                "failed to upload",
+            )
+        return uploaded
+
+    def index(self, file: File, parent_id: str | None = None) -> File:
+        """Record a created or updated file in the remote index, if any."""
+        if self.remote_index is not None:
+            self.remote_index.put(file, parent_id)
+        return file
+
+    def create_remote_folder(self, name: str, parent_id: str) -> File:
+        folder = self.index(
+            self.helper.create_folder(
+                name,
+                parent_id,
+                fields=self.DefaultFieldsGet,
+            ),
+            parent_id,
+        )
+        if self.remote_index is not None:
+            # a new folder is known to be empty
+            self.remote_index.put_listing(folder["id"], [])
+        return folder
+
+    def update_file(self, file_id: str, filepath: Path) -> File:
+        indexed = self.get_indexed(file_id)
+        return self.index(
+            self.helper.update_file(
+                file_id,
+                filepath,
+                resumable=filepath.stat().st_size > self.ResumableThreshold,
+                chunk_size=self.UploadChunkSize,
+                num_retries=self.NumRetries,
+                fields=self.DefaultFieldsGet,
+            ),
+            next(iter(indexed.get("parents", [])), None) if indexed else None,
+        )
+
+    def _upload_folder(
+        self,
+        path: Path,
+        parent_id: str,
+        executor: ThreadPoolExecutor,
+    ) -> list[Future[File]]:
+        """Recreate a local folder remotely, submitting its file uploads.
+
+        Folders are created first, parents before their children.
+        """
+        folder_ids = {
+            Path(): self.create_remote_folder(path.name, parent_id)["id"],
+        }
+        futures: list[Future[File]] = []
+        for relpath, stat in sorted(self.scan_local(path).items()):
+            remote_parent_id = folder_ids[relpath.parent]
+            if S_ISDIR(stat.st_mode):
+                folder_ids[relpath] = self.create_remote_folder(
+                    relpath.name,
+                    remote_parent_id,
+                )["id"]
+            elif S_ISREG(stat.st_mode):
+                futures.append(
+                    executor.submit(
+                        self.upload_file_to_folder,
+                        path / relpath,
+                        remote_parent_id,
+                    ),
+                )
+        return futures
+
+    @staticmethod
+    def _sync_action(
+        diff: DiffObj,
+        direction: SyncDirection,
+    ) -> Literal["upload", "download"] | None:
+        if "type" not in diff:
+            return None
+        if diff["side"] == "local":
+            return "upload" if direction != "download" else None
+        if diff["side"] == "remote":
+            return "download" if direction != "upload" else None
+        if direction != "both":
+            return direction
+        local_mtime = Path(diff["path"]).stat().st_mtime
+        remote_mtime = datetime.fromisoformat(
+            diff["file"]["modifiedTime"],
+        ).timestamp()
+        return "upload" if local_mtime > remote_mtime else "download"
+
+    def _apply_diff(
+        self,
+        path: Path,
+        diff: DiffObj,
+        executor: ThreadPoolExecutor,
+        max_workers: int,
+        *,
+        refresh: bool = False,
+    ) -> list[Future[Any]]:
+        """Submit the transfers of a diff planned by `sync`."""
+        file = diff.get("file")
+        # remote-only diffs have paths relative to the synced folder
+        local_path = (
+            path / diff["path"]
+            if diff["side"] == "remote"
+            else Path(diff["path"])
+        )
+        if diff["comment"] == "upload":
+            if diff["type"] == "folder":
+                return list(
+                    self._upload_folder(
+                        local_path,
+                        diff["parent_id"],
+                        executor,
+                    ),
+                )
+            if file is None:
+                return [
+                    executor.submit(
+                        self.upload_file_to_folder,
+                        local_path,
+                        diff["parent_id"],
+                    ),
+                ]
+            return [executor.submit(self.update_file, file["id"], local_path)]
+
+        if file is None:
+            return []
+        if diff["type"] == "folder":
+            self.download_folder(
+                file["id"],
+                local_path.parent,
+                local_path.name,
+                max_workers=max_workers,
+                refresh=refresh,
+            )
+            return []
+        return [
+            executor.submit(
+                self.download_file,
+                file,
+                path=local_path.parent,
+                options=DownloadOptions(ignore_existing=False),
+            ),
+        ]
+
+    def sync(
+        self,
+        path: Path,
+        folder_id: str,
+        direction: SyncDirection = "both",
+        *,
+        dry_run: bool = False,
+        max_workers: int = DefaultMaxWorkers,
+        hash_workers: int | None = None,
+        refresh: bool = False,
+    ) -> list[DiffObj]:
+        """Transfer the differences between a local and a remote folder.
+
+        `upload` and `download` bring the missing or changed files to the
+        remote or local side respectively. `both` transfers the missing
+        files each way and changed files from the most recently modified
+        side. Nothing is ever deleted, and conflicting file/folder types
+        are skipped, as are native Google files which have no content to
+        download or compare.
+
+        The applied diffs are returned with their action as comment,
+        with `dry_run` they are returned without being applied.
+        Remote listings come from the remote index if any, `refresh`
+        lists them again so that changes made by other clients are seen.
+        """
+        plan: list[DiffObj] = []
+        for diff in self._compare_folders(
+            path,
+            folder_id,
+            max_workers=max_workers,
+            hash_workers=hash_workers,
+            refresh=refresh,
+        ):
+            if (
+                diff.get("type") == "file"
+                and (file := diff.get("file")) is not None
+                and not self.is_downloadable(file["mimeType"])
+            ):
+                self.logger.info("Skipping native Google file: %s", diff)
+                continue
+            if (action := self._sync_action(diff, direction)) is None:
+                if "type" not in diff:
+                    self.logger.warning("Conflicting types: %s", diff)
+                continue
+            plan.append({**diff, "comment": action})
+
+        if dry_run:
+            return plan
+
+        futures: list[Future[Any]] = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for diff in plan:
+                futures.extend(
+                    self._apply_diff(
+                        path,
+                        diff,
+                        executor,
+                        max_workers,
+                        refresh=refresh,
+                    ),
+                )
+
+            failed = 0
+            for future in as_completed(futures):
+                if (exc := future.exception()) is not None:
+                    failed += 1
+                    self.logger.error("Failed to sync: %s", exc)
+
+        if failed:
+            raise OperationalError(f"{failed}/{len(futures)} transfers failed")
+        return plan
 
 
 googledrive = GoogleDrive(default_drive_helper)
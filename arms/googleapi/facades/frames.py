@@ -0,0 +1,100 @@
+"""Conversions between sheet values and NumPy arrays or pandas frames.
+
+Requires the `frames` extra.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike
+
+type Frame = pd.DataFrame | np.ndarray[Any, Any]
+
+DateTimeFormat = "%Y-%m-%d %H:%M:%S"
+
+
+def _column_values(series: pd.Series[Any]) -> pd.Series[Any]:
+    """Convert a column to JSON serializable values, missing ones empty.
+
+    Infinite numbers, which JSON cannot represent, are emptied too.
+    Datetimes are formatted with `DateTimeFormat`, as text.
+    """
+    present = series.notna()
+    if pd.api.types.is_datetime64_any_dtype(series):
+        converted = series.dt.strftime(DateTimeFormat)
+    elif pd.api.types.is_numeric_dtype(
+        series,
+    ) or pd.api.types.is_bool_dtype(series):
+        # boxing to object turns NumPy scalars into Python ones
+        converted = series.astype(object)
+        present &= ~series.isin([np.inf, -np.inf])
+    else:
+        converted = series.astype(str)
+    return converted.where(present, "")
+
+
+def frame_to_values(
+    frame: Frame,
+    *,
+    header: bool = True,
+    index: bool = False,
+) -> list[list[Any]]:
+    """Convert a frame to rows of values, column by column.
+
+    Arrays have no header. Column names are written as the first row
+    with `header`, the index as the first columns with `index`.
+    """
+    if isinstance(frame, np.ndarray):
+        frame = pd.DataFrame(np.atleast_2d(frame))
+        header = False
+    if index:
+        frame = frame.reset_index()
+    converted = pd.DataFrame(
+        {
+            pos: _column_values(series)
+            for pos, (_, series) in enumerate(frame.items())
+        },
+        index=frame.index,
+    )
+    values: list[list[Any]] = converted.to_numpy(dtype=object).tolist()
+    if header:
+        values.insert(0, [str(column) for column in frame.columns])
+    return values
+
+
+def values_to_frame(
+    values: list[list[Any]],
+    *,
+    header: bool = True,
+) -> pd.DataFrame:
+    """Build a frame from rows of values, as returned by the API.
+
+    Trailing empty cells are omitted by the API, short rows are padded
+    with missing values. With `header`, the first row names the columns.
+    """
+    if not values:
+        return pd.DataFrame()
+    if not header:
+        return pd.DataFrame(values)
+    columns, *rows = values
+    frame = pd.DataFrame(rows)
+    width = max(frame.shape[1], len(columns))
+    frame = frame.reindex(columns=range(width))
+    frame.columns = pd.Index([*columns, *range(len(columns), width)])
+    return frame.convert_dtypes()
+
+
+def values_to_array(
+    values: list[list[Any]],
+    dtype: DTypeLike = None,
+) -> np.ndarray[Any, Any]:
+    """Build a 2D array from rows of values, padding short rows."""
+    frame = values_to_frame(values, header=False)
+    if dtype is not None and np.issubdtype(np.dtype(dtype), np.number):
+        frame = frame.apply(pd.to_numeric, errors="coerce")
+    return frame.to_numpy(dtype=dtype)
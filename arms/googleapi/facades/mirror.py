@@ -0,0 +1,451 @@
+from __future__ import annotations
+
+import json
+import logging
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, ClassVar, TypedDict
+
+from .drive import (
+    DiffObj,
+    DownloadOptions,
+    GoogleDrive,
+    OperationalError,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from googleapiclient._apis.drive.v3.schemas import Change, File
+
+
+class MirrorState(TypedDict):
+    folder_id: str
+    page_token: str
+    # relative paths in the mirror, keyed by remote ID
+    folders: dict[str, str]
+    files: dict[str, str]
+
+
+class DriveMirror:
+    """Local one-way mirror of a remote folder, fed by the changes feed.
+
+    The first run crawls the whole tree, later runs only fetch the
+    changes since the checkpoint saved in `state_path`, so that their
+    cost grows with the number of changes rather than the tree size.
+    Files and folders trashed, removed or moved out of the tree are
+    deleted locally.
+    """
+
+    DefaultFieldsChangeFile: ClassVar[list[str]] = [
+        *GoogleDrive.DefaultFieldsFile,
+        "parents",
+        "trashed",
+    ]
+    DefaultFieldsChanges: str = (
+        "nextPageToken, newStartPageToken, changes(changeType, removed, "
+        f"fileId, file({', '.join(DefaultFieldsChangeFile)}))"
+    )
+    Root: str = "."
+
+    def __init__(
+        self,
+        drive: GoogleDrive,
+        folder_id: str,
+        path: Path,
+        state_path: Path,
+        drive_id: str | None = None,
+    ) -> None:
+        self.drive = drive
+        self.folder_id = folder_id
+        self.path = path
+        self.state_path = state_path
+        self.drive_id = drive_id
+        self.logger = logging.getLogger(
+            f"{__name__}.{self.__class__.__name__}",
+        )
+
+    def load_state(self) -> MirrorState | None:
+        if not self.state_path.is_file():
+            return None
+        with self.state_path.open(encoding="utf8") as readfile:
+            state: MirrorState = json.load(readfile)
+        if state["folder_id"] != self.folder_id:
+            raise ValueError(
+                f"state {self.state_path} tracks folder {state['folder_id']}",
+            )
+        return state
+
+    def save_state(self, state: MirrorState) -> None:
+        """Write the state to a sibling file, then move it in place."""
+        partpath = self.state_path.with_name(f".{self.state_path.name}.part")
+        with partpath.open("w", encoding="utf8") as writefile:
+            json.dump(state, writefile, ensure_ascii=False)
+        partpath.replace(self.state_path)
+
+    def run(
+        self,
+        max_workers: int = GoogleDrive.DefaultMaxWorkers,
+    ) -> list[DiffObj]:
+        """Bring the mirror up to date, returning the applied diffs.
+
+        The state is only saved once every download succeeded, a failed
+        run is replayed from the previous checkpoint.
+        """
+        state = self.load_state()
+        if state is None:
+            return self.full_run(max_workers)
+        return self.incremental_run(state, max_workers)
+
+    def _download_many(
+        self,
+        files: list[tuple[File, str]],
+        max_workers: int,
+    ) -> None:
+        options = DownloadOptions(ignore_existing=False)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: dict[Future[None], str] = {
+                executor.submit(
+                    self.drive.download_file,
+                    file,
+                    path=(self.path / relpath).parent,
+                    options=options,
+                ): relpath
+                for file, relpath in files
+            }
+            failed = 0
+            for future in as_completed(futures):
+                if (exc := future.exception()) is not None:
+                    failed += 1
+                    self.logger.error(
+                        "Failed to download %s: %s",
+                        futures[future],
+                        exc,
+                    )
+        if failed:
+            raise OperationalError(
+                f"{failed}/{len(futures)} files failed to download",
+            )
+
+    def _crawl(
+        self,
+        state: MirrorState,
+        folder_id: str,
+        max_workers: int,
+    ) -> tuple[list[DiffObj], list[tuple[File, str]]]:
+        """Add the whole subtree of a mirrored folder to the state.
+
+        Returns the diffs and the files to download.
+        """
+        root = PurePosixPath(state["folders"][folder_id])
+        diffs: list[DiffObj] = []
+        downloads: list[tuple[File, str]] = []
+        remote = self.drive.crawl_remote(
+            folder_id,
+            max_workers=max_workers,
+            refresh=True,
+            drive_id=self.drive_id,
+        )
+        for relpath, file in sorted(remote.items()):
+            mirrored = (root / relpath.as_posix()).as_posix()
+            if self.drive.is_remote_folder(file):
+                (self.path / mirrored).mkdir(exist_ok=True)
+                state["folders"][file["id"]] = mirrored
+            elif self.drive.is_downloadable(file["mimeType"]):
+                state["files"][file["id"]] = mirrored
+                downloads.append((file, mirrored))
+                diffs.append(
+                    self.drive.mkdiff(
+                        "remote",
+                        Path(mirrored),
+                        type_="file",
+                        comment="download",
+                        file=file,
+                    ),
+                )
+        return diffs, downloads
+
+    def full_run(
+        self,
+        max_workers: int = GoogleDrive.DefaultMaxWorkers,
+    ) -> list[DiffObj]:
+        """Mirror the whole tree and take the first checkpoint.
+
+        The checkpoint is taken before crawling, so that changes made
+        during the crawl are replayed by the next run.
+        """
+        page_token = self.drive.helper.get_start_page_token(self.drive_id)
+        state = MirrorState(
+            folder_id=self.folder_id,
+            page_token=page_token,
+            folders={self.folder_id: self.Root},
+            files={},
+        )
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        diffs, downloads = self._crawl(state, self.folder_id, max_workers)
+        self._download_many(downloads, max_workers)
+        self.save_state(state)
+        return diffs
+
+    def iter_changes(self, page_token: str) -> tuple[dict[str, Change], str]:
+        """Fetch the changes since `page_token`, the last one per file.
+
+        Returns them with the token of the next checkpoint.
+        """
+        changes: dict[str, Change] = {}
+        while True:
+            response = self.drive.helper.list_changes(
+                page_token,
+                self.DefaultFieldsChanges,
+                page_size=GoogleDrive.MaxPageSize,
+                drive_id=self.drive_id,
+            )
+            for change in response.get("changes", []):
+                if change.get("changeType", "file") == "file":
+                    changes.pop(change["fileId"], None)
+                    changes[change["fileId"]] = change
+            if "newStartPageToken" in response:
+                return changes, response["newStartPageToken"]
+            page_token = response["nextPageToken"]
+
+    @staticmethod
+    def _is_gone(change: Change) -> bool:
+        return change.get("removed", False) or change["file"].get(
+            "trashed",
+            False,
+        )
+
+    def _relocate(self, state: MirrorState, old: str, new: str) -> None:
+        """Update the paths of a moved folder and of its descendants."""
+        old_path = PurePosixPath(old)
+        for mapping in (state["folders"], state["files"]):
+            for remote_id, relpath in mapping.items():
+                if PurePosixPath(relpath).is_relative_to(old_path):
+                    mapping[remote_id] = (
+                        PurePosixPath(new)
+                        / PurePosixPath(relpath).relative_to(old_path)
+                    ).as_posix()
+
+    def _forget(self, state: MirrorState, relpath: str) -> None:
+        """Drop a deleted folder and its descendants from the state."""
+        root = PurePosixPath(relpath)
+        for mapping in (state["folders"], state["files"]):
+            for remote_id in [
+                remote_id
+                for remote_id, child in mapping.items()
+                if PurePosixPath(child).is_relative_to(root)
+            ]:
+                del mapping[remote_id]
+
+    def _move_local(self, old: str, new: str) -> None:
+        if (self.path / old).exists():
+            (self.path / old).replace(self.path / new)
+
+    def _apply_folders(
+        self,
+        state: MirrorState,
+        changes: dict[str, Change],
+    ) -> tuple[list[DiffObj], list[str], list[str]]:
+        """Create or move the changed folders, parents first.
+
+        Returns the diffs, the IDs of the folders to delete and those of
+        the folders seen for the first time, parents first.
+        """
+        diffs: list[DiffObj] = []
+        created: list[str] = []
+        pending = {
+            file_id: change["file"]
+            for file_id, change in changes.items()
+            if not self._is_gone(change)
+            and self.drive.is_remote_folder(change["file"])
+            and file_id != self.folder_id
+        }
+        progress = True
+        while pending and progress:
+            progress = False
+            for file_id, file in list(pending.items()):
+                parent_id = next(iter(file.get("parents", [])), None)
+                if parent_id not in state["folders"]:
+                    continue
+                del pending[file_id]
+                progress = True
+                relpath = (
+                    PurePosixPath(state["folders"][parent_id]) / file["name"]
+                ).as_posix()
+                if (old := state["folders"].get(file_id)) is None:
+                    (self.path / relpath).mkdir(exist_ok=True)
+                    state["folders"][file_id] = relpath
+                    created.append(file_id)
+                    diffs.append(
+                        self.drive.mkdiff(
+                            "remote",
+                            Path(relpath),
+                            type_="folder",
+                            comment="create",
+                            file=file,
+                        ),
+                    )
+                elif old != relpath:
+                    self._move_local(old, relpath)
+                    self._relocate(state, old, relpath)
+                    diffs.append(
+                        self.drive.mkdiff(
+                            "remote",
+                            Path(relpath),
+                            type_="folder",
+                            comment="move",
+                            file=file,
+                        ),
+                    )
+
+        # folders left pending were moved out of the tree
+        removed = [
+            file_id
+            for file_id, change in changes.items()
+            if file_id in state["folders"]
+            and file_id != self.folder_id
+            and (file_id in pending or self._is_gone(change))
+        ]
+        return diffs, removed, created
+
+    def _apply_files(
+        self,
+        state: MirrorState,
+        changes: dict[str, Change],
+        removed: list[str],
+    ) -> tuple[list[DiffObj], list[tuple[File, str]]]:
+        """Move or delete the changed files, returning the downloads.
+
+        Files left in the `removed` folders are deleted along with them.
+        """
+        removed_paths = [
+            PurePosixPath(state["folders"][folder_id]) for folder_id in removed
+        ]
+        diffs: list[DiffObj] = []
+        downloads: list[tuple[File, str]] = []
+        for file_id, change in changes.items():
+            file = change.get("file")
+            if file is not None and self.drive.is_remote_folder(file):
+                continue
+            old = state["files"].get(file_id)
+            parent_id = (
+                next(iter(file.get("parents", [])), None) if file else None
+            )
+            relpath = (
+                PurePosixPath(state["folders"][parent_id]) / file["name"]
+                if file and parent_id in state["folders"]
+                else None
+            )
+            if (
+                file is None
+                or relpath is None
+                or self._is_gone(change)
+                or not self.drive.is_downloadable(file["mimeType"])
+                or any(map(relpath.is_relative_to, removed_paths))
+            ):
+                if old is not None:
+                    (self.path / old).unlink(missing_ok=True)
+                    del state["files"][file_id]
+                    diffs.append(
+                        self.drive.mkdiff(
+                            "local",
+                            Path(old),
+                            type_="file",
+                            comment="delete",
+                        ),
+                    )
+                continue
+
+            if old is not None and old != relpath.as_posix():
+                self._move_local(old, relpath.as_posix())
+            state["files"][file_id] = relpath.as_posix()
+            downloads.append((file, relpath.as_posix()))
+            diffs.append(
+                self.drive.mkdiff(
+                    "remote",
+                    Path(relpath),
+                    type_="file",
+                    comment="download",
+                    file=file,
+                ),
+            )
+        return diffs, downloads
+
+    def _crawl_created(
+        self,
+        state: MirrorState,
+        created: list[str],
+        downloads: list[tuple[File, str]],
+        max_workers: int,
+    ) -> list[DiffObj]:
+        """Crawl the folders seen for the first time, queuing downloads.
+
+        A folder moved into the tree or restored from the trash brings
+        its content along, without any change for it in the feed.
+        Subfolders of a crawled folder are covered by its crawl.
+        """
+        queued = {file["id"] for file, _ in downloads}
+        crawled: list[PurePosixPath] = []
+        diffs: list[DiffObj] = []
+        for folder_id in created:
+            relpath = PurePosixPath(state["folders"][folder_id])
+            if any(map(relpath.is_relative_to, crawled)):
+                continue
+            crawled.append(relpath)
+            crawl_diffs, crawl_downloads = self._crawl(
+                state,
+                folder_id,
+                max_workers,
+            )
+            for diff, (file, mirrored) in zip(
+                crawl_diffs,
+                crawl_downloads,
+                strict=True,
+            ):
+                if file["id"] not in queued:
+                    queued.add(file["id"])
+                    downloads.append((file, mirrored))
+                    diffs.append(diff)
+        return diffs
+
+    def incremental_run(
+        self,
+        state: MirrorState,
+        max_workers: int = GoogleDrive.DefaultMaxWorkers,
+    ) -> list[DiffObj]:
+        """Apply the changes since the checkpoint of `state`.
+
+        Files are moved before the removed folders are deleted, so that
+        files moved out of a deleted folder are not downloaded again.
+        Changed files are only downloaded when their MD5 differs. The
+        content of folders seen for the first time is crawled.
+        """
+        changes, page_token = self.iter_changes(state["page_token"])
+        self.logger.info("%d changes since last run", len(changes))
+
+        diffs, removed, created = self._apply_folders(state, changes)
+        file_diffs, downloads = self._apply_files(state, changes, removed)
+        diffs.extend(file_diffs)
+        diffs.extend(
+            self._crawl_created(state, created, downloads, max_workers),
+        )
+        for file_id in removed:
+            if (relpath := state["folders"].get(file_id)) is None:
+                continue
+            shutil.rmtree(self.path / relpath, ignore_errors=True)
+            self._forget(state, relpath)
+            diffs.append(
+                self.drive.mkdiff(
+                    "local",
+                    Path(relpath),
+                    type_="folder",
+                    comment="delete",
+                ),
+            )
+
+        self._download_many(downloads, max_workers)
+        state["page_token"] = page_token
+        self.save_state(state)
+        return diffs
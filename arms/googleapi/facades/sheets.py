@@ -1,21 +1,61 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Literal, Self, cast
 
+from ..helpers import a1
+from ..helpers.a1 import A1Range
 from ..helpers.sheets import SpreadsheetsHelper, default_sheets_helper
 
 if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable, Iterator, Sequence
+    from concurrent.futures import Future
+    from types import TracebackType
+
+    import numpy as np
     from googleapiclient._apis.sheets.v4.schemas import (
         BatchUpdateSpreadsheetResponse,
+        BatchUpdateValuesResponse,
         ClearValuesResponse,
+        Request,
         UpdateValuesResponse,
+        ValueRange,
     )
+    from numpy.typing import DTypeLike
+    from pandas import DataFrame
 
-    from ..typedefs import SheetsData
+    from ..typedefs import (
+        SheetsData,
+        ValueInputOption,
+        ValueRenderOption,
+    )
+    from .frames import Frame
 
 _DefaultA1Notation = "A1"
 _DefaultA1NotationAll = "A1:ZZ"
 
+# fetched range if closed, with its values
+type CachedBlock = tuple[A1Range | None, list[list[Any]]]
+
+
+class PartialWriteError(Exception):
+    """Writing rows stopped at a failed chunk.
+
+    `last_row` is the last row written without a gap from the start,
+    `responses` are those of the chunks written up to it.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        last_row: int,
+        responses: list[UpdateValuesResponse],
+    ) -> None:
+        super().__init__(message, last_row)
+        self.last_row = last_row
+        self.responses = responses
+
 
 class Sheet:
     def __init__(
@@ -30,7 +70,7 @@ class Sheet:
 
     def ownrange(self, range_: str) -> str:
         if self.name:
-            return f"{self.name}!{range_}"
+            return f"{a1.quote_title(self.name)}!{range_}"
         return range_
 
     def write(
@@ -50,6 +90,68 @@ class Sheet:
             option=option,
         )
 
+    def write_rows(
+        self,
+        rows: Iterable[Sequence[str]],
+        range_: str = _DefaultA1Notation,
+        option: ValueInputOption = "USER_ENTERED",
+        max_workers: int = 1,
+    ) -> list[UpdateValuesResponse]:
+        return self.service.write_rows(
+            self.book.id_,
+            rows,
+            self.ownrange(range_),
+            option=option,
+            max_workers=max_workers,
+        )
+
+    def read(
+        self,
+        range_: str = _DefaultA1NotationAll,
+        render_option: ValueRenderOption = "FORMATTED_VALUE",
+    ) -> Iterator[list[Any]]:
+        return self.book.read_many([self.ownrange(range_)], render_option)[0]
+
+    def write_frame(
+        self,
+        frame: Frame,
+        range_: str = _DefaultA1Notation,
+        *,
+        header: bool = True,
+        index: bool = False,
+        max_workers: int = 1,
+    ) -> list[UpdateValuesResponse]:
+        return self.book.write_frame(
+            frame,
+            self.ownrange(range_),
+            header=header,
+            index=index,
+            max_workers=max_workers,
+        )
+
+    def read_frame(
+        self,
+        range_: str = _DefaultA1NotationAll,
+        *,
+        header: bool = True,
+    ) -> DataFrame:
+        return self.book.read_frame(self.ownrange(range_), header=header)
+
+    def read_array(
+        self,
+        range_: str = _DefaultA1NotationAll,
+        dtype: DTypeLike = None,
+    ) -> np.ndarray[Any, Any]:
+        return self.book.read_array(self.ownrange(range_), dtype=dtype)
+
+    def sync_values(
+        self,
+        data: SheetsData,
+        range_: str = _DefaultA1Notation,
+        option: ValueInputOption = "USER_ENTERED",
+    ) -> list[BatchUpdateValuesResponse]:
+        return self.book.sync_values(data, self.ownrange(range_), option)
+
     def clear_all_values(
         self,
         range_: str = _DefaultA1NotationAll,
@@ -59,6 +161,105 @@ class Sheet:
         )
 
 
+class Batch:
+    """Buffer of writes to a book, sent in as few requests as possible.
+
+    Value writes are sent with one `values.batchUpdate` per input
+    option, formatting with one `spreadsheets.batchUpdate`. Buffers are
+    flushed when leaving the context without error, or as soon as one
+    of the thresholds is reached. The responses are kept in order in
+    `values_responses` and `format_responses`.
+    """
+
+    MaxValueRanges: int = 100
+    MaxCells: int = 100_000
+    MaxRequests: int = 100
+
+    def __init__(
+        self,
+        book: Book,
+        max_value_ranges: int = MaxValueRanges,
+        max_cells: int = MaxCells,
+        max_requests: int = MaxRequests,
+    ) -> None:
+        self.book = book
+        self.max_value_ranges = max_value_ranges
+        self.max_cells = max_cells
+        self.max_requests = max_requests
+        self.values_responses: list[BatchUpdateValuesResponse] = []
+        self.format_responses: list[BatchUpdateSpreadsheetResponse] = []
+        self._values: dict[ValueInputOption, list[ValueRange]] = {}
+        self._cells = 0
+        self._requests: list[Request] = []
+
+    @property
+    def helper(self) -> SpreadsheetsHelper:
+        return self.book.service.helper
+
+    def write(
+        self,
+        data: SheetsData,
+        range_: str = _DefaultA1Notation,
+        option: ValueInputOption = "USER_ENTERED",
+    ) -> None:
+        self._values.setdefault(option, []).append(
+            {"range": range_, "values": data},
+        )
+        self._cells += sum(map(len, data))
+        if (
+            sum(map(len, self._values.values())) >= self.max_value_ranges
+            or self._cells >= self.max_cells
+        ):
+            self.flush_values()
+
+    def write_to_sheet(
+        self,
+        sheet_name: str,
+        data: SheetsData,
+        range_: str = _DefaultA1Notation,
+        option: ValueInputOption = "USER_ENTERED",
+    ) -> None:
+        self.write(data, self.book.sheet(sheet_name).ownrange(range_), option)
+
+    def update_currency_format(self, range_: str) -> None:
+        self._requests.append(
+            self.helper.currency_format_request(self.book.id_, range_),
+        )
+        if len(self._requests) >= self.max_requests:
+            self.flush_format()
+
+    def flush_values(self) -> None:
+        values, self._values, self._cells = self._values, {}, 0
+        for option, data in values.items():
+            self.values_responses.append(
+                self.helper.batch_update_values(self.book.id_, data, option),
+            )
+
+    def flush_format(self) -> None:
+        requests, self._requests = self._requests, []
+        if requests:
+            self.format_responses.append(
+                self.helper.batch_update(self.book.id_, requests),
+            )
+
+    def flush(self) -> None:
+        """Send the buffered values, then the formatting."""
+        self.flush_values()
+        self.flush_format()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.flush()
+
+
 class Book:
     def __init__(
         self,
@@ -71,6 +272,22 @@ class Book:
     def sheet(self, sheet_name: str) -> Sheet:
         return Sheet(sheet_name, self, self.service)
 
+    def batch(
+        self,
+        max_value_ranges: int = Batch.MaxValueRanges,
+        max_cells: int = Batch.MaxCells,
+        max_requests: int = Batch.MaxRequests,
+    ) -> Batch:
+        """Buffer writes and formatting, to be used as a context manager.
+
+        ```
+        with book.batch() as batch:
+            batch.write_to_sheet("Sheet1", data, "A1")
+            batch.update_currency_format("Sheet1!B2:B")
+        ```
+        """
+        return Batch(self, max_value_ranges, max_cells, max_requests)
+
     def write_to_sheet(
         self,
         sheet_name: str,
@@ -107,6 +324,130 @@ class Book:
             option=option,
         )
 
+    def write_rows(
+        self,
+        rows: Iterable[Sequence[str]],
+        range_: str = _DefaultA1Notation,
+        option: ValueInputOption = "USER_ENTERED",
+        max_workers: int = 1,
+    ) -> list[UpdateValuesResponse]:
+        return self.service.write_rows(
+            self.id_,
+            rows,
+            range_,
+            option=option,
+            max_workers=max_workers,
+        )
+
+    def write_frame(
+        self,
+        frame: Frame,
+        range_: str = _DefaultA1Notation,
+        *,
+        header: bool = True,
+        index: bool = False,
+        max_workers: int = 1,
+    ) -> list[UpdateValuesResponse]:
+        """Write a pandas frame or a NumPy array, raw, in chunks.
+
+        Values are not parsed, so datetimes land as text rather than
+        dates. Requires the `frames` extra, see `frames.frame_to_values`.
+        """
+        from .frames import frame_to_values
+
+        return self.write_rows(
+            frame_to_values(frame, header=header, index=index),
+            range_,
+            option="RAW",
+            max_workers=max_workers,
+        )
+
+    def read_many(
+        self,
+        ranges: Sequence[str],
+        render_option: ValueRenderOption = "FORMATTED_VALUE",
+    ) -> list[Iterator[list[Any]]]:
+        return self.service.read_many(self.id_, ranges, render_option)
+
+    def sync_values(
+        self,
+        data: SheetsData,
+        range_: str = _DefaultA1Notation,
+        option: ValueInputOption = "USER_ENTERED",
+    ) -> list[BatchUpdateValuesResponse]:
+        """Make the values from `range_` onwards equal to `data`.
+
+        Unlike clearing then writing, only the changed cells are sent,
+        grouped into rectangular blocks written in batch. Cells outside
+        `data` but inside the read area are cleared. Values are compared
+        as strings to both the formulas and the formatted values, so that
+        dates or currencies entered as displayed are left untouched.
+        """
+        start = a1.parse(range_)
+        row, col = start.start()
+        area = A1Range(
+            start.title,
+            row,
+            col,
+            None,
+            a1.parse(_DefaultA1NotationAll).last_col,
+        )
+        current = list(
+            self.read_many([str(area)], render_option="FORMULA")[0],
+        )
+        formatted = list(
+            self.read_many([str(area)], render_option="FORMATTED_VALUE")[0],
+        )
+        with self.batch() as batch:
+            for row_offset, col_offset, values in GoogleSheet.diff_blocks(
+                current,
+                data,
+                formatted,
+            ):
+                block = A1Range.from_cell(
+                    start.title,
+                    row + row_offset,
+                    col + col_offset,
+                    len(values),
+                    len(values[0]),
+                )
+                batch.write(values, str(block), option)
+        return batch.values_responses
+
+    def read_frame(
+        self,
+        range_: str = _DefaultA1NotationAll,
+        *,
+        header: bool = True,
+    ) -> DataFrame:
+        """Read unformatted values into a pandas frame.
+
+        Requires the `frames` extra.
+        """
+        from .frames import values_to_frame
+
+        return values_to_frame(
+            self.service.get_values(self.id_, range_, "UNFORMATTED_VALUE"),
+            header=header,
+        )
+
+    def read_array(
+        self,
+        range_: str = _DefaultA1NotationAll,
+        dtype: DTypeLike = None,
+    ) -> np.ndarray[Any, Any]:
+        """Read unformatted values into a 2D NumPy array.
+
+        With a numeric `dtype`, non numeric cells are read as NaN.
+        Requires the `frames` extra.
+        """
+        from .frames import values_to_array
+
+        return values_to_array(
+            self.service.get_values(self.id_, range_, "UNFORMATTED_VALUE"),
+            dtype=dtype,
+        )
+
     def update_currency_format(
         self,
         range_: str,
@@ -125,10 +466,23 @@ class Book:
             range_=range_,
         )
 
+    def invalidate_metadata(self) -> None:
+        """Forget the cached sheet properties, e.g. after adding a sheet."""
+        self.service.helper.invalidate_properties(self.id_)
+
 
 class GoogleSheet:
+    # https://developers.google.com/sheets/api/limits
+    MaxChunkRows: int = 10_000
+    MaxChunkBytes: int = 2 * 1024 * 1024
+
     def __init__(self, helper: SpreadsheetsHelper) -> None:
         self.helper = helper
+        self._read_cache: dict[
+            tuple[str, ValueRenderOption],
+            tuple[str, dict[str, CachedBlock]],
+        ] = {}
+        self._read_cache_lock = threading.Lock()
 
     def book(self, book_id: str | None = None) -> Book:
         if book_id is None:
@@ -156,6 +510,265 @@ class GoogleSheet:
             value_input_option=option,
         )
 
+    def get_values(
+        self,
+        book_id: str,
+        range_: str,
+        render_option: ValueRenderOption = "FORMATTED_VALUE",
+    ) -> list[list[Any]]:
+        response = self.helper.get_values_in_ranges(
+            book_id,
+            [range_],
+            value_render_option=render_option,
+        )
+        value_ranges = response.get("valueRanges", [])
+        return value_ranges[0].get("values", []) if value_ranges else []
+
+    @staticmethod
+    def _slice_rows(
+        block: CachedBlock,
+        range_: A1Range | None,
+    ) -> Iterator[list[Any]]:
+        block_range, values = block
+        if range_ is None or block_range is None:
+            yield from values
+            return
+        first_row, first_col, last_row, last_col = range_.bounds()
+        block_row, block_col = block_range.start()
+        for row in values[first_row - block_row : last_row - block_row + 1]:
+            yield row[first_col - block_col : last_col - block_col + 1]
+
+    def read_many(
+        self,
+        book_id: str,
+        ranges: Sequence[str],
+        render_option: ValueRenderOption = "FORMATTED_VALUE",
+    ) -> list[Iterator[list[Any]]]:
+        """Read many ranges, fetching what is missing in a single batchGet.
+
+        Closed ranges of a sheet that overlap or touch are fetched as
+        their bounding box. Fetched values are cached until the version
+        of the spreadsheet changes, which costs one metadata request per
+        call. Rows come as in the API, with trailing empty cells and
+        rows omitted.
+        """
+        version = self.helper.get_version(book_id)
+        key = (book_id, render_option)
+        with self._read_cache_lock:
+            cached_version, blocks = self._read_cache.get(key, ("", {}))
+        if cached_version != version:
+            blocks = {}
+
+        def find(key: str, closed: A1Range | None) -> CachedBlock | None:
+            if closed is None:
+                return blocks.get(key)
+            return next(
+                (
+                    block
+                    for block in blocks.values()
+                    if block[0] is not None and block[0].contains(closed)
+                ),
+                None,
+            )
+
+        requested: list[tuple[str, A1Range | None]] = []
+        for range_ in ranges:
+            parsed = a1.parse(range_)
+            requested.append((range_, parsed if parsed.is_closed else None))
+        missing = [item for item in requested if find(*item) is None]
+        to_fetch: list[tuple[str, A1Range | None]] = [
+            (str(merged), merged)
+            for merged in a1.coalesce(
+                closed for _, closed in missing if closed is not None
+            )
+        ]
+        to_fetch += [
+            (range_, None) for range_, closed in missing if closed is None
+        ]
+        if to_fetch:
+            response = self.helper.get_values_in_ranges(
+                book_id,
+                [range_ for range_, _ in to_fetch],
+                value_render_option=render_option,
+            )
+            blocks = blocks | {
+                range_: (closed, value_range.get("values", []))
+                for (range_, closed), value_range in zip(
+                    to_fetch,
+                    response.get("valueRanges", []),
+                    strict=True,
+                )
+            }
+            with self._read_cache_lock:
+                self._read_cache[key] = (version, blocks)
+
+        return [
+            self._slice_rows(cast("CachedBlock", find(range_, closed)), closed)
+            for range_, closed in requested
+        ]
+
+    def invalidate_reads(self, book_id: str | None = None) -> None:
+        with self._read_cache_lock:
+            for key in list(self._read_cache):
+                if book_id is None or key[0] == book_id:
+                    del self._read_cache[key]
+
+    @staticmethod
+    def diff_blocks(
+        current: Sequence[Sequence[Any]],
+        data: Sequence[Sequence[Any]],
+        formatted: Sequence[Sequence[Any]] = (),
+    ) -> list[tuple[int, int, SheetsData]]:
+        """Find the rectangular blocks of cells to write to get `data`.
+
+        Changed cells are grouped into runs per row, and runs spanning
+        the same columns in consecutive rows are stacked. Returns the
+        row and column offsets of each block with its values, cells
+        missing from `data` being cleared. A cell also counts as
+        unchanged when it matches the other render of `formatted`.
+        """
+
+        def cell(rows: Sequence[Sequence[Any]], row: int, col: int) -> str:
+            if row < len(rows) and col < len(rows[row]):
+                return str(rows[row][col])
+            return ""
+
+        def unchanged(row: int, col: int) -> bool:
+            value = cell(data, row, col)
+            return value == cell(current, row, col) or (
+                row < len(formatted)
+                and col < len(formatted[row])
+                and value == str(formatted[row][col])
+            )
+
+        blocks: list[tuple[int, int, SheetsData]] = []
+        # blocks still growing, keyed by their columns span
+        open_blocks: dict[tuple[int, int], tuple[int, int, SheetsData]] = {}
+        for row in range(max(len(current), len(data))):
+            width = max(
+                len(current[row]) if row < len(current) else 0,
+                len(data[row]) if row < len(data) else 0,
+            )
+            runs: list[tuple[int, int]] = []
+            for col in range(width):
+                if unchanged(row, col):
+                    continue
+                if runs and runs[-1][1] == col:
+                    runs[-1] = (runs[-1][0], col + 1)
+                else:
+                    runs.append((col, col + 1))
+
+            grown: dict[tuple[int, int], tuple[int, int, SheetsData]] = {}
+            for start, end in runs:
+                values = [cell(data, row, col) for col in range(start, end)]
+                if (block := open_blocks.pop((start, end), None)) is not None:
+                    block[2].append(values)
+                else:
+                    block = (row, start, [values])
+                grown[start, end] = block
+            blocks.extend(open_blocks.values())
+            open_blocks = grown
+        blocks.extend(open_blocks.values())
+        return sorted(blocks, key=lambda block: block[:2])
+
+    @staticmethod
+    def chunk_rows(
+        rows: Iterable[Sequence[str]],
+        max_rows: int = MaxChunkRows,
+        max_bytes: int = MaxChunkBytes,
+    ) -> Generator[SheetsData, None, None]:
+        """Group rows into chunks bounded in rows and approximate size."""
+        chunk: SheetsData = []
+        size = 0
+        for row in rows:
+            # quotes and separators of the JSON body
+            row_size = sum(len(str(cell)) + 3 for cell in row) + 2
+            if chunk and (
+                len(chunk) >= max_rows or size + row_size > max_bytes
+            ):
+                yield chunk
+                chunk, size = [], 0
+            chunk.append(list(row))
+            size += row_size
+        if chunk:
+            yield chunk
+
+    def write_rows(
+        self,
+        book_id: str,
+        rows: Iterable[Sequence[str]],
+        range_: str = _DefaultA1Notation,
+        option: ValueInputOption = "USER_ENTERED",
+        max_workers: int = 1,
+    ) -> list[UpdateValuesResponse]:
+        """Stream rows to a sheet, one bounded chunk per request.
+
+        Rows are consumed lazily from `range_` downwards, each chunk
+        being written to its own computed range. With `max_workers`
+        above 1, chunks are written concurrently while at most twice as
+        many are held in memory. Responses follow the chunks order.
+
+        Writing stops at the first failed chunk, cancelling the chunks
+        not started yet, and raises `PartialWriteError` with the last
+        row written. Chunks already in flight may still be written.
+        """
+        start = a1.parse(range_)
+        row, col = start.start()
+        futures: list[Future[UpdateValuesResponse]] = []
+        last_rows: list[int] = []
+        slots = threading.BoundedSemaphore(max_workers * 2)
+        failed = threading.Event()
+
+        def on_done(future: Future[UpdateValuesResponse]) -> None:
+            if not future.cancelled() and future.exception() is not None:
+                failed.set()
+                # chunks run in order, only later ones can be cancelled
+                for pending in futures:
+                    pending.cancel()
+            slots.release()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for chunk in self.chunk_rows(
+                rows,
+                self.MaxChunkRows,
+                self.MaxChunkBytes,
+            ):
+                chunk_range = A1Range.from_cell(
+                    start.title,
+                    row,
+                    col,
+                    len(chunk),
+                    max(map(len, chunk)) or 1,
+                )
+                row += len(chunk)
+                slots.acquire()
+                if failed.is_set():
+                    break
+                future = executor.submit(
+                    self.update_values,
+                    book_id,
+                    chunk,
+                    str(chunk_range),
+                    option=option,
+                )
+                futures.append(future)
+                last_rows.append(cast("int", chunk_range.last_row))
+                future.add_done_callback(on_done)
+
+        responses: list[UpdateValuesResponse] = []
+        written = start.start()[0] - 1
+        for future, last_row in zip(futures, last_rows, strict=True):
+            if (exc := future.exception()) is not None:
+                raise PartialWriteError(
+                    f"failed to write rows {written + 1}-{last_row}, "
+                    f"rows written up to {written}",
+                    written,
+                    responses,
+                ) from exc
+            responses.append(future.result())
+            written = last_row
+        return responses
+
     def update_currency_format(
         self,
         book_id: str,
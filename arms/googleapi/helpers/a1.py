@@ -0,0 +1,263 @@
+"""A1 notation parsing and range algebra.
+
+https://developers.google.com/sheets/api/guides/concepts#cell
+"""
+
+from __future__ import annotations
+
+import re
+import string
+from functools import lru_cache
+from itertools import product
+from typing import TYPE_CHECKING, NamedTuple, Self, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+    from googleapiclient._apis.sheets.v4.schemas import GridRange
+
+# https://support.google.com/docs/answer/37603
+MaxColumns = 18278  # ZZZ
+
+
+def _column_names() -> list[str]:
+    names = [""]
+    for length in (1, 2, 3):
+        names.extend(
+            map("".join, product(string.ascii_uppercase, repeat=length)),
+        )
+    return names
+
+
+# index -> name and name -> index, 1-based
+_ColumnNames = _column_names()
+_ColumnNumbers = {name: num for num, name in enumerate(_ColumnNames)}
+
+_PatternCell = re.compile(r"([A-Za-z]{0,3})(\d*)")
+_PatternUnquotedTitle = re.compile(r"\w+")
+
+
+def col2num(col: str) -> int:
+    if (num := _ColumnNumbers.get(col.upper())) is None:
+        raise ValueError(f"invalid column: {col}")
+    return num
+
+
+def num2col(num: int) -> str:
+    if not 0 < num <= MaxColumns:
+        raise ValueError(f"column out of range: {num}")
+    return _ColumnNames[num]
+
+
+def quote_title(title: str) -> str:
+    if _PatternUnquotedTitle.fullmatch(title):
+        return title
+    return "'{}'".format(title.replace("'", "''"))
+
+
+class A1Range(NamedTuple):
+    """A range of cells, with 1-based inclusive bounds.
+
+    Missing bounds leave the range open, up to the edge of the sheet.
+    An empty title refers to the first visible sheet.
+    """
+
+    title: str = ""
+    first_row: int | None = None
+    first_col: int | None = None
+    last_row: int | None = None
+    last_col: int | None = None
+
+    @property
+    def is_closed(self) -> bool:
+        return None not in self[1:]
+
+    @property
+    def rows(self) -> int | None:
+        if self.first_row is None or self.last_row is None:
+            return None
+        return self.last_row - self.first_row + 1
+
+    @property
+    def cols(self) -> int | None:
+        if self.first_col is None or self.last_col is None:
+            return None
+        return self.last_col - self.first_col + 1
+
+    @classmethod
+    def from_cell(
+        cls,
+        title: str,
+        row: int,
+        col: int,
+        rows: int = 1,
+        cols: int = 1,
+    ) -> Self:
+        """Range of `rows` by `cols` cells from a top-left cell."""
+        return cls(title, row, col, row + rows - 1, col + cols - 1)
+
+    def start(self) -> tuple[int, int]:
+        """Top-left cell as row and column, open bounds starting at 1."""
+        return self.first_row or 1, self.first_col or 1
+
+    def __str__(self) -> str:
+        start = (
+            f"{num2col(self.first_col) if self.first_col else ''}"
+            f"{self.first_row or ''}"
+        )
+        end = (
+            f"{num2col(self.last_col) if self.last_col else ''}"
+            f"{self.last_row or ''}"
+        )
+        if self.first_row and self.first_col and start == end:
+            cells = start
+        elif start or end:
+            cells = f"{start}:{end}"
+        else:
+            cells = ""
+        if not self.title:
+            return cells
+        if not cells:
+            return quote_title(self.title)
+        return f"{quote_title(self.title)}!{cells}"
+
+    def to_gridrange(self, sheet_id: int) -> GridRange:
+        """Convert to a GridRange, with 0-based half-open indices."""
+        gridrange = {
+            "sheetId": sheet_id,
+            "startRowIndex": (
+                self.first_row - 1 if self.first_row is not None else None
+            ),
+            "endRowIndex": self.last_row,
+            "startColumnIndex": (
+                self.first_col - 1 if self.first_col is not None else None
+            ),
+            "endColumnIndex": self.last_col,
+        }
+        return cast(
+            "GridRange",
+            {k: v for k, v in gridrange.items() if v is not None},
+        )
+
+    def contains(self, other: A1Range) -> bool:
+        """Whether `other` lies within this range, open bounds included."""
+
+        def above(low: int | None, value: int | None) -> bool:
+            return low is None or (value is not None and low <= value)
+
+        def below(value: int | None, high: int | None) -> bool:
+            return high is None or (value is not None and value <= high)
+
+        return (
+            self.title == other.title
+            and above(self.first_row, other.first_row)
+            and above(self.first_col, other.first_col)
+            and below(other.last_row, self.last_row)
+            and below(other.last_col, self.last_col)
+        )
+
+    def bounds(self) -> tuple[int, int, int, int]:
+        """First row, first column, last row and last column."""
+        if not self.is_closed:
+            raise ValueError(f"range {self} is not closed")
+        return cast("tuple[int, int, int, int]", tuple(self[1:]))
+
+    def touches(self, other: A1Range) -> bool:
+        """Whether two closed ranges overlap or are adjacent."""
+        if not (
+            self.title == other.title and self.is_closed and other.is_closed
+        ):
+            return False
+        first, second = self.bounds(), other.bounds()
+        return (
+            first[0] <= second[2] + 1
+            and second[0] <= first[2] + 1
+            and first[1] <= second[3] + 1
+            and second[1] <= first[3] + 1
+        )
+
+    def union(self, other: A1Range) -> A1Range:
+        """Smallest closed range containing two closed ranges."""
+        if self.title != other.title:
+            raise ValueError("ranges are on different sheets")
+        first, second = self.bounds(), other.bounds()
+        return A1Range(
+            self.title,
+            min(first[0], second[0]),
+            min(first[1], second[1]),
+            max(first[2], second[2]),
+            max(first[3], second[3]),
+        )
+
+    def split_rows(self, rows: int) -> Generator[A1Range, None, None]:
+        """Split a range into consecutive ranges of at most `rows` rows."""
+        if self.first_row is None or self.last_row is None:
+            raise ValueError("range must have bounded rows")
+        for first in range(self.first_row, self.last_row + 1, rows):
+            yield self._replace(
+                first_row=first,
+                last_row=min(first + rows - 1, self.last_row),
+            )
+
+
+def _is_cell(cell: str) -> bool:
+    match = _PatternCell.fullmatch(cell)
+    return bool(cell and match and match[1].upper() in _ColumnNumbers)
+
+
+def _parse_cell(cell: str, a1: str) -> tuple[int | None, int | None]:
+    if not _is_cell(cell):
+        raise ValueError(f"invalid a1 notation: {a1}")
+    col, row = cast("re.Match[str]", _PatternCell.fullmatch(cell)).groups()
+    if row and int(row) == 0:
+        raise ValueError(f"invalid row 0 in a1 notation: {a1}")
+    return int(row) if row else None, col2num(col) if col else None
+
+
+@lru_cache(maxsize=4096)
+def parse(a1: str, titles: frozenset[str] = frozenset()) -> A1Range:
+    """Parse an A1 notation, e.g. `'My Sheet'!A1:B`, `A:A` or `B2`.
+
+    A lone name refers to a whole sheet, a lone cell to itself.
+    Bounds are normalized so that the first ones are the smallest.
+
+    Without a `!`, a name which is also a valid range, like `ABC` or
+    `Q1`, is ambiguous. It is read as a range unless it is one of the
+    known sheet `titles`, quoting it always refers to the sheet.
+    """
+    title, sep, cells = a1.rpartition("!")
+    if not sep and (a1 in titles or not all(map(_is_cell, a1.split(":", 1)))):
+        # a name which is not a valid range refers to a sheet
+        title, cells = a1, ""
+    if len(title) > 1 and title[0] == title[-1] == "'":
+        title = title[1:-1].replace("''", "'")
+
+    if not cells:
+        return A1Range(title)
+    start, sep, end = cells.partition(":")
+    first_row, first_col = _parse_cell(start, a1)
+    if not sep:
+        return A1Range(title, first_row, first_col, first_row, first_col)
+    last_row, last_col = _parse_cell(end, a1)
+    if first_row is not None and last_row is not None:
+        first_row, last_row = sorted((first_row, last_row))
+    if first_col is not None and last_col is not None:
+        first_col, last_col = sorted((first_col, last_col))
+    return A1Range(title, first_row, first_col, last_row, last_col)
+
+
+def coalesce(ranges: Iterable[A1Range]) -> list[A1Range]:
+    """Merge overlapping or adjacent closed ranges into bounding boxes.
+
+    Open ranges are kept as they are.
+    """
+    merged: list[A1Range] = []
+    for item in sorted(set(ranges), key=str):
+        current = item
+        while (
+            other := next((o for o in merged if o.touches(current)), None)
+        ) is not None:
+            merged.remove(other)
+            current = current.union(other)
+        merged.append(current)
+    return merged
@@ -1,38 +1,121 @@
 from __future__ import annotations
 
+import json
 import logging
-from functools import cached_property
+import random
+import time
 from mimetypes import guess_type
-from typing import TYPE_CHECKING
-
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
+from typing import TYPE_CHECKING, Any, cast
 
+from ..payloads.enums import MimeType
 from .factory import GoogleServiceFactory, default_google_service_factory
 
 if TYPE_CHECKING:
-    from io import BytesIO
+    from collections.abc import Sequence
+    from io import IOBase
     from pathlib import Path
 
     from googleapiclient._apis.drive.v3 import DriveResource
     from googleapiclient._apis.drive.v3.schemas import (
+        ChangeList,
         File,
         FileList,
         Permission,
     )
+    from googleapiclient.errors import HttpError
+    from googleapiclient.http import HttpRequest, MediaFileUpload
 
 
 class DriveHelper:
     # https://github.com/googleworkspace/python-samples/tree/main/drive/snippets/drive-v3
+    MaxBatchSize: int = 100
+    RateLimitReasons: frozenset[str] = frozenset(
+        {"rateLimitExceeded", "userRateLimitExceeded"},
+    )
+    TooManyRequestsStatusCode: int = 429
+    ServerErrorStatusCode: int = 500
+    # googleapiclient.http.DEFAULT_CHUNK_SIZE
+    DefaultChunkSize: int = 100 * 1024 * 1024
+
     def __init__(self, factory: GoogleServiceFactory) -> None:
         self.factory = factory
         self.logger = logging.getLogger(
             f"{__name__}.{self.__class__.__name__}",
         )
 
-    @cached_property
+    @property
     def service(self) -> DriveResource:
+        """Drive service of the calling thread, see `GoogleServiceFactory`."""
         return self.factory.drive
 
+    def is_retryable(self, error: HttpError) -> bool:
+        """Whether a failed call was rate limited or hit a server error."""
+        status = error.resp.status
+        if (
+            status == self.TooManyRequestsStatusCode
+            or status >= self.ServerErrorStatusCode
+        ):
+            return True
+        if status != 403:  # noqa: PLR2004
+            return False
+        try:
+            errors = json.loads(error.content)["error"]["errors"]
+        except (ValueError, KeyError, TypeError):
+            return False
+        return any(
+            item.get("reason") in self.RateLimitReasons for item in errors
+        )
+
+    def execute_many(
+        self,
+        requests: Sequence[HttpRequest],
+        num_retries: int = 0,
+    ) -> list[Any]:
+        """Execute requests packing up to `MaxBatchSize` calls per round trip.
+
+        Results follow the order of `requests`,
+        a failed call results in its `HttpError` instead of raising it.
+        Calls failing with a rate limit or server error are sent again
+        in a new batch, up to `num_retries` times with exponential
+        backoff, the successful ones are not repeated.
+
+        https://developers.google.com/drive/api/guides/performance#batch-requests
+        """
+        results: list[Any] = [None] * len(requests)
+
+        def callback(
+            request_id: str,
+            response: Any,
+            exception: HttpError | None,
+        ) -> None:
+            results[int(request_id)] = exception or response
+
+        pending = list(range(len(requests)))
+        for attempt in range(num_retries + 1):
+            if attempt:
+                # same backoff as googleapiclient for single requests
+                time.sleep(random.random() * 2**attempt)  # noqa: S311
+            for start in range(0, len(pending), self.MaxBatchSize):
+                batch = self.service.new_batch_http_request(callback=callback)
+                for idx in pending[start : start + self.MaxBatchSize]:
+                    batch.add(requests[idx], request_id=str(idx))
+                batch.execute()
+            pending = [
+                idx
+                for idx in pending
+                if isinstance(results[idx], Exception)
+                and self.is_retryable(results[idx])
+            ]
+            if not pending:
+                break
+            self.logger.warning(
+                "%d batched calls failed, retry %d/%d",
+                len(pending),
+                attempt + 1,
+                num_retries,
+            )
+        return results
+
     def grant_permissions(
         self,
         file_id: str,
@@ -47,31 +130,117 @@ class DriveHelper:
             .execute()
         )
 
+    def grant_permissions_many(
+        self,
+        file_ids: Sequence[str],
+        perm_obj: Permission,
+        num_retries: int = 0,
+    ) -> list[Permission | HttpError]:
+        permissions = self.service.permissions()
+        return self.execute_many(
+            [
+                permissions.create(fileId=file_id, body=perm_obj)
+                for file_id in file_ids
+            ],
+            num_retries=num_retries,
+        )
+
     def delete_file(self, file_id: str) -> str:
         # on success, it returns an empty string
         return self.service.files().delete(fileId=file_id).execute()
 
+    def delete_many(
+        self,
+        file_ids: Sequence[str],
+        num_retries: int = 0,
+    ) -> list[str | HttpError]:
+        files = self.service.files()
+        return self.execute_many(
+            [files.delete(fileId=file_id) for file_id in file_ids],
+            num_retries=num_retries,
+        )
+
     def get_metadata(self, file_id: str, fields: str = "*") -> File:
         return (
             self.service.files().get(fileId=file_id, fields=fields).execute()
         )
 
+    def get_metadata_many(
+        self,
+        file_ids: Sequence[str],
+        fields: str = "*",
+        num_retries: int = 0,
+    ) -> list[File | HttpError]:
+        files = self.service.files()
+        return self.execute_many(
+            [files.get(fileId=file_id, fields=fields) for file_id in file_ids],
+            num_retries=num_retries,
+        )
+
     def list_folder(
         self,
         folder_id: str,
         fields: str,
         page_size: int = 100,
+        page_token: str | None = None,
+        drive_id: str | None = None,
     ) -> FileList:
-        """List file in a folder.
+        """List file in a folder, of the shared drive `drive_id` if any.
 
+        Trashed files are left out, as they are no longer in the tree.
         https://developers.google.com/drive/api/reference/rest/v3/files/list
         """
         return (
             self.service.files()
             .list(
                 pageSize=page_size,
-                q=f"'{folder_id}' in parents",
+                pageToken=page_token,
+                q=f"'{folder_id}' in parents and trashed = false",
                 fields=fields,
+                corpora="drive" if drive_id is not None else None,
+                driveId=drive_id,
+                includeItemsFromAllDrives=drive_id is not None,
+                supportsAllDrives=drive_id is not None,
+            )
+            .execute()
+        )
+
+    def get_start_page_token(self, drive_id: str | None = None) -> str:
+        """Get the token marking the current position in the changes feed.
+
+        https://developers.google.com/drive/api/guides/manage-changes
+        """
+        response = (
+            self.service.changes()
+            .getStartPageToken(
+                driveId=drive_id,
+                supportsAllDrives=drive_id is not None,
+            )
+            .execute()
+        )
+        return response["startPageToken"]
+
+    def list_changes(
+        self,
+        page_token: str,
+        fields: str,
+        page_size: int = 1000,
+        drive_id: str | None = None,
+    ) -> ChangeList:
+        """List changes, removals included, since `page_token`.
+
+        https://developers.google.com/drive/api/reference/rest/v3/changes/list
+        """
+        return (
+            self.service.changes()
+            .list(
+                pageToken=page_token,
+                pageSize=page_size,
+                fields=fields,
+                includeRemoved=True,
+                driveId=drive_id,
+                includeItemsFromAllDrives=drive_id is not None,
+                supportsAllDrives=drive_id is not None,
             )
             .execute()
         )
@@ -83,10 +252,14 @@ class DriveHelper:
     def download_file(
         self,
         file_id: str,
-        buffer: BytesIO,
+        buffer: IOBase,
+        chunk_size: int = DefaultChunkSize,
     ) -> None:
+        """Download a file chunk by chunk into a writable binary stream."""
+        from googleapiclient.http import MediaIoBaseDownload
+
         request = self.service.files().get_media(fileId=file_id)
-        downloader = MediaIoBaseDownload(buffer, request)
+        downloader = MediaIoBaseDownload(buffer, request, chunksize=chunk_size)
         done: bool = False
         while not done:
             status, done = downloader.next_chunk()
@@ -95,31 +268,99 @@ class DriveHelper:
                 self.to_percent(status.progress()),
             )
 
+    @staticmethod
+    def media(
+        filepath: Path,
+        chunk_size: int = DefaultChunkSize,
+        *,
+        resumable: bool = False,
+    ) -> MediaFileUpload:
+        from googleapiclient.http import MediaFileUpload
+
+        mimetype, _ = guess_type(str(filepath))
+        return MediaFileUpload(
+            str(filepath),
+            mimetype=mimetype,
+            chunksize=chunk_size,
+            resumable=resumable,
+        )
+
+    def execute_upload(
+        self,
+        request: HttpRequest,
+        num_retries: int = 0,
+    ) -> File:
+        """Execute an upload, chunk by chunk if its media is resumable.
+
+        Each chunk is retried up to `num_retries` times with exponential
+        backoff, resuming the upload where it failed instead of from zero.
+        """
+        if not (request.resumable and request.resumable.resumable()):
+            return cast("File", request.execute(num_retries=num_retries))
+        response = None
+        while response is None:
+            status, response = request.next_chunk(num_retries=num_retries)
+            if status:
+                self.logger.debug(
+                    "Uploading (%s)",
+                    self.to_percent(status.progress()),
+                )
+        return cast("File", response)
+
     def upload_file_to_folder(
         self,
         filepath: Path,
         folder_id: str,
         *,
         resumable: bool = False,
+        chunk_size: int = DefaultChunkSize,
+        num_retries: int = 0,
+        fields: str | None = None,
     ) -> File:
         metadata: File = {
             "name": filepath.name,
             "parents": [folder_id],
         }
-        mimetype, _ = guess_type(str(filepath))
-        media = MediaFileUpload(
-            str(filepath),
-            mimetype=mimetype,
-            resumable=resumable,
+        request = self.service.files().create(
+            body=metadata,
+            media_body=self.media(filepath, chunk_size, resumable=resumable),
+            fields=fields,
         )
+        return self.execute_upload(request, num_retries=num_retries)
+
+    def create_folder(
+        self,
+        name: str,
+        parent_id: str,
+        fields: str | None = None,
+    ) -> File:
+        metadata: File = {
+            "name": name,
+            "mimeType": MimeType.GoogleAppsFolder,
+            "parents": [parent_id],
+        }
         return (
-            self.service.files()
-            .create(
-                body=metadata,
-                media_body=media,
-            )
-            .execute()
+            self.service.files().create(body=metadata, fields=fields).execute()
+        )
+
+    def update_file(
+        self,
+        file_id: str,
+        filepath: Path,
+        *,
+        resumable: bool = False,
+        chunk_size: int = DefaultChunkSize,
+        num_retries: int = 0,
+        fields: str | None = None,
+    ) -> File:
+        """Replace the content of a file."""
+        request = self.service.files().update(
+            fileId=file_id,
+            body={},
+            media_body=self.media(filepath, chunk_size, resumable=resumable),
+            fields=fields,
         )
+        return self.execute_upload(request, num_retries=num_retries)
 
 
 default_drive_helper = DriveHelper(default_google_service_factory)
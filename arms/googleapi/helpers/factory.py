@@ -1,18 +1,32 @@
 from __future__ import annotations
 
+import json
 import os
-from functools import cached_property
-from typing import TYPE_CHECKING, ClassVar
-
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+import threading
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
+    from google.oauth2.service_account import Credentials
     from googleapiclient._apis.drive.v3.resources import DriveResource
     from googleapiclient._apis.sheets.v4.resources import SheetsResource
 
 
 class GoogleServiceFactory:
+    """Build Google API services from service account credentials.
+
+    Services are built from discovery documents read from disk, either
+    from `discovery_dir` or the ones shipped with googleapiclient, once
+    per factory. Each build parses its own copy, as googleapiclient
+    modifies the document in place. googleapiclient and google-auth are
+    only imported when the first service is built.
+
+    googleapiclient services wrap an httplib2.Http which is not
+    thread-safe, so `drive` and `spreadsheets` hand out one service per
+    thread. They all share the same credentials, hence a single token.
+    """
+
     DefaultEnvVar: str = "GOOGLEAPI_SERVICE_ACCOUNT_PATH"
     mp_perm_scopes: ClassVar[dict[str, list[str]]] = {
         "drive": [
@@ -24,11 +38,21 @@ class GoogleServiceFactory:
         ],
     }
 
-    def __init__(self, service_account_path: str | None = None) -> None:
+    def __init__(
+        self,
+        service_account_path: str | None = None,
+        discovery_dir: Path | None = None,
+    ) -> None:
         self._service_account_path = (
             service_account_path or self.default_service_account_path
         )
         self._permissions = self.mp_perm_scopes.keys()
+        self.discovery_dir = discovery_dir
+        self._discovery: dict[tuple[str, str], str] = {}
+        self._discovery_lock = threading.Lock()
+        self._credentials: Credentials | None = None
+        self._credentials_lock = threading.Lock()
+        self._local = threading.local()
 
     @property
     def default_service_account_path(self) -> str:
@@ -45,11 +69,35 @@ class GoogleServiceFactory:
                 f"set it in env var {self.DefaultEnvVar} "
                 "or explicitly pass it in the constructor.",
             )
+        from google.oauth2.service_account import Credentials
+
         return Credentials.from_service_account_file(  # type: ignore[no-untyped-call]
             self.service_account_path,
             scopes=scopes,
         )
 
+    @property
+    def credentials(self) -> Credentials:
+        """Credentials shared by the services, loaded on first use.
+
+        They hold the scopes of every permission, so that a single token
+        serves all services. google-auth refreshes a stale token in the
+        background, one refresh at a time, while requests keep using it.
+        """
+        with self._credentials_lock:
+            if self._credentials is None:
+                scopes = sorted(
+                    {
+                        scope
+                        for scopes in self.mp_perm_scopes.values()
+                        for scope in scopes
+                    },
+                )
+                credentials = self.get_credentials(scopes)
+                credentials.with_non_blocking_refresh()  # type: ignore[no-untyped-call]
+                self._credentials = credentials
+            return self._credentials
+
     def get_scopes(self, permission: str) -> list[str]:
         if permission not in self.mp_perm_scopes:
             raise ValueError(
@@ -58,16 +106,76 @@ class GoogleServiceFactory:
             )
         return self.mp_perm_scopes[permission]
 
-    @cached_property
-    def spreadsheets(self) -> SheetsResource.SpreadsheetsResource:
-        credentials = self.get_credentials(self.get_scopes("spreadsheets"))
-        svc: SheetsResource = build("sheets", "v4", credentials=credentials)
+    def _read_discovery(self, name: str, version: str) -> str:
+        if self.discovery_dir is not None:
+            path = self.discovery_dir / f"{name}.{version}.json"
+            if path.is_file():
+                return path.read_text(encoding="utf8")
+        from googleapiclient.discovery_cache import get_static_doc
+
+        content = get_static_doc(name, version)  # type: ignore[no-untyped-call]
+        if content is None:
+            raise RuntimeError(
+                f"No discovery document found for {name} {version}",
+            )
+        return str(content)
+
+    def get_discovery_document(
+        self,
+        name: str,
+        version: str,
+    ) -> dict[str, Any]:
+        """Discovery document of an API, read on first use.
+
+        Every call returns a newly parsed document, safe to modify.
+        """
+        with self._discovery_lock:
+            if (name, version) not in self._discovery:
+                self._discovery[name, version] = self._read_discovery(
+                    name,
+                    version,
+                )
+            content = self._discovery[name, version]
+        document: dict[str, Any] = json.loads(content)
+        return document
+
+    def build(self, name: str, version: str) -> Any:
+        """Build a service without fetching its discovery document."""
+        from googleapiclient.discovery import (  # type: ignore[attr-defined]
+            build_from_document,
+        )
+
+        return build_from_document(
+            self.get_discovery_document(name, version),
+            credentials=self.credentials,
+        )
+
+    def build_spreadsheets(self) -> SheetsResource.SpreadsheetsResource:
+        """Build a new spreadsheets service, for use in a single thread."""
+        svc: SheetsResource = self.build("sheets", "v4")
         return svc.spreadsheets()
 
-    @cached_property
+    @property
+    def spreadsheets(self) -> SheetsResource.SpreadsheetsResource:
+        """Spreadsheets service of the calling thread."""
+        if not hasattr(self._local, "spreadsheets"):
+            self._local.spreadsheets = self.build_spreadsheets()
+        return cast(
+            "SheetsResource.SpreadsheetsResource",
+            self._local.spreadsheets,
+        )
+
+    def build_drive(self) -> DriveResource:
+        """Build a new drive service, for use in a single thread."""
+        drive: DriveResource = self.build("drive", "v3")
+        return drive
+
+    @property
     def drive(self) -> DriveResource:
-        credentials = self.get_credentials(self.get_scopes("drive"))
-        return build("drive", "v3", credentials=credentials)
+        """Drive service of the calling thread."""
+        if not hasattr(self._local, "drive"):
+            self._local.drive = self.build_drive()
+        return cast("DriveResource", self._local.drive)
 
 
 default_google_service_factory = GoogleServiceFactory()
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import mmap
+import sqlite3
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import os
+    from pathlib import Path
+
+_1MB_In_Bytes = 1024 * 1024
+
+
+def md5(filepath: Path, chunk_size: int = _1MB_In_Bytes) -> str:
+    """Hash a file, memory-mapping it to avoid copying it into buffers."""
+    hash_md5 = hashlib.md5()  # noqa: S324
+    with filepath.open("rb") as readfile:
+        if filepath.stat().st_size < chunk_size:
+            hash_md5.update(readfile.read())
+            return hash_md5.hexdigest()
+        with (
+            mmap.mmap(readfile.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            memoryview(mapped) as view,
+        ):
+            for offset in range(0, len(view), chunk_size):
+                hash_md5.update(view[offset : offset + chunk_size])
+    return hash_md5.hexdigest()
+
+
+class HashCache:
+    """Persistent index of local MD5 digests, stored in SQLite.
+
+    A digest is reused as long as the size, mtime and inode of its file
+    are unchanged, so unchanged files are never hashed twice.
+    The cache is safe to share between threads.
+    """
+
+    Schema: str = """
+        CREATE TABLE IF NOT EXISTS md5 (
+            path TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            inode INTEGER NOT NULL,
+            digest TEXT NOT NULL
+        )
+    """
+
+    def __init__(self, path: Path | str = ":memory:") -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(self.Schema)
+
+    def get(self, filepath: Path, stat: os.stat_result) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest FROM md5 "
+                "WHERE path = ? AND size = ? AND mtime_ns = ? AND inode = ?",
+                (
+                    str(filepath.absolute()),
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    stat.st_ino,
+                ),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, filepath: Path, stat: os.stat_result, digest: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO md5 VALUES (?, ?, ?, ?, ?)",
+                (
+                    str(filepath.absolute()),
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    stat.st_ino,
+                    digest,
+                ),
+            )
+
+    def md5(self, filepath: Path, stat: os.stat_result | None = None) -> str:
+        """Get the digest of a file, hashing it only if it changed.
+
+        `stat` can be passed when already known, e.g. from `os.scandir`.
+        """
+        stat = stat or filepath.stat()
+        if (digest := self.get(filepath, stat)) is not None:
+            return digest
+        digest = md5(filepath)
+        self.put(filepath, stat, digest)
+        return digest
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from googleapiclient._apis.drive.v3.schemas import File
+
+
+class RemoteIndex:
+    """Persistent index of remote Drive trees, stored in SQLite.
+
+    Files are indexed by ID and by parent and name. The children of a
+    folder are only served from the index once its whole listing was
+    stored, other lookups are left to the API. Entries are trusted
+    until a folder is listed again, the index does not follow changes
+    made by other clients. The index is safe to share between threads.
+    """
+
+    Schema: str = """
+        CREATE TABLE IF NOT EXISTS files (
+            id TEXT PRIMARY KEY,
+            parent TEXT,
+            name TEXT NOT NULL,
+            mime_type TEXT NOT NULL,
+            size INTEGER,
+            md5_checksum TEXT,
+            modified_time TEXT
+        );
+        CREATE INDEX IF NOT EXISTS files_parent_name ON files (parent, name);
+        CREATE TABLE IF NOT EXISTS listed (id TEXT PRIMARY KEY);
+    """
+    Columns: str = (
+        "id, name, mime_type, size, md5_checksum, modified_time, parent"
+    )
+
+    def __init__(self, path: Path | str = ":memory:") -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(self.Schema)
+
+    @staticmethod
+    def _to_row(file: File, parent_id: str | None) -> tuple[Any, ...]:
+        size = file.get("size")
+        return (
+            file["id"],
+            parent_id,
+            file["name"],
+            file["mimeType"],
+            int(size) if size is not None else None,
+            file.get("md5Checksum"),
+            file.get("modifiedTime"),
+        )
+
+    @staticmethod
+    def _to_file(row: tuple[Any, ...]) -> File:
+        file_id, name, mimetype, size, md5, modified_time, parent = row
+        file: File = {
+            "kind": "drive#file",
+            "id": file_id,
+            "name": name,
+            "mimeType": mimetype,
+        }
+        if size is not None:
+            file["size"] = str(size)
+        if md5 is not None:
+            file["md5Checksum"] = md5
+        if modified_time is not None:
+            file["modifiedTime"] = modified_time
+        if parent is not None:
+            file["parents"] = [parent]
+        return file
+
+    def put(self, file: File, parent_id: str | None = None) -> None:
+        """Index a single file, e.g. after creating or updating it.
+
+        The parent defaults to the first one in the metadata, if any.
+        """
+        parent_id = parent_id or next(iter(file.get("parents", [])), None)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._to_row(file, parent_id),
+            )
+
+    def put_listing(self, folder_id: str, files: Iterable[File]) -> None:
+        """Replace the indexed children of a folder by its full listing."""
+        rows = [self._to_row(file, folder_id) for file in files]
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM files WHERE parent = ?",
+                (folder_id,),
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO listed VALUES (?)",
+                (folder_id,),
+            )
+
+    def get(self, file_id: str) -> File | None:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self.Columns} FROM files WHERE id = ?",  # noqa: S608
+                (file_id,),
+            ).fetchone()
+        return self._to_file(row) if row else None
+
+    def children(self, folder_id: str) -> list[File] | None:
+        """Get the children of a folder, None if it was never listed."""
+        with self._lock:
+            if not self._conn.execute(
+                "SELECT 1 FROM listed WHERE id = ?",
+                (folder_id,),
+            ).fetchone():
+                return None
+            rows = self._conn.execute(
+                f"SELECT {self.Columns} FROM files "  # noqa: S608
+                "WHERE parent = ? ORDER BY name",
+                (folder_id,),
+            ).fetchall()
+        return [self._to_file(row) for row in rows]
+
+    def child(self, folder_id: str, name: str) -> File | None:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self.Columns} FROM files "  # noqa: S608
+                "WHERE parent = ? AND name = ?",
+                (folder_id, name),
+            ).fetchone()
+        return self._to_file(row) if row else None
+
+    def resolve(self, folder_id: str, relpath: Path) -> File | None:
+        """Find a file by its path relative to a folder."""
+        file: File | None = None
+        for name in relpath.parts:
+            if (file := self.child(folder_id, name)) is None:
+                return None
+            folder_id = file["id"]
+        return file
+
+    def remove(self, file_id: str) -> None:
+        """Drop a file, the listing of its parent being kept complete."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+            self._conn.execute("DELETE FROM listed WHERE id = ?", (file_id,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM files")
+            self._conn.execute("DELETE FROM listed")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
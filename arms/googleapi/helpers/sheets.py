@@ -1,97 +1,156 @@
 from __future__ import annotations
 
-import re
-import string
-from functools import cached_property
-from typing import TYPE_CHECKING, Literal, cast
+import threading
+from typing import TYPE_CHECKING, Literal
 
+from . import a1
 from .factory import GoogleServiceFactory, default_google_service_factory
 
 if TYPE_CHECKING:
+    from googleapiclient._apis.drive.v3.resources import DriveResource
     from googleapiclient._apis.sheets.v4.resources import SheetsResource
     from googleapiclient._apis.sheets.v4.schemas import (
         BatchGetValuesResponse,
         BatchUpdateSpreadsheetResponse,
+        BatchUpdateValuesResponse,
         ClearValuesResponse,
         GridRange,
-        Sheet,
+        Request,
+        SheetProperties,
         Spreadsheet,
         SpreadsheetProperties,
         UpdateValuesResponse,
         ValueRange,
     )
 
-
-_PatternA1Notation = re.compile(r"^(?:(.+)!)*(\D+)(\d*):(\D+)(\d*)$")
-_DefaultA1NotationAll = "A1:ZZ"
+    from ..typedefs import ValueInputOption, ValueRenderOption
 
 
-def col2num(col: str) -> int:
-    num = 0
-    for c in col:
-        if c in string.ascii_letters:
-            num = num * 26 + (ord(c.upper()) - ord("A")) + 1
-    return num
+_DefaultA1NotationAll = "A1:ZZ"
 
 
 class SpreadsheetsHelper:
     # https://github.com/googleworkspace/python-samples/tree/main/sheets/snippets
     def __init__(self, factory: GoogleServiceFactory) -> None:
         self.factory = factory
+        self._properties: dict[str, list[SheetProperties]] = {}
+        self._properties_lock = threading.Lock()
 
-    @cached_property
+    @property
     def service(self) -> SheetsResource.SpreadsheetsResource:
+        """Spreadsheets service of the calling thread.
+
+        See `GoogleServiceFactory`.
+        """
         return self.factory.spreadsheets
 
-    def _a1notation_to_gridrange(
-        self,
-        spreadsheet_id: str,
-        a1: str,
-        sheet_title: str = "",
-        sheet_index: int | None = None,
-    ) -> GridRange:
-        # https://gist.github.com/tanaikech/95c7cd650837f33a564babcaf013cae0
-        match = _PatternA1Notation.match(a1)
-        if not match:
-            raise ValueError(f"invalid a1 notation: {a1}")
-        title, scol, srow, ecol, erow = match.groups()
+    @property
+    def drive(self) -> DriveResource:
+        """Drive service of the calling thread, for file level metadata."""
+        return self.factory.drive
 
-        if not scol:
-            raise ValueError(f"start column required in {a1}")
+    def get_version(self, spreadsheet_id: str) -> str:
+        """Get the version of a spreadsheet, increased by every change."""
+        return (
+            self.drive.files()
+            .get(fileId=spreadsheet_id, fields="version")
+            .execute()["version"]
+        )
 
-        sheet_title = title or sheet_title
-        sheet_id = 0
+    def get_sheets_properties(
+        self,
+        spreadsheet_id: str,
+        *,
+        refresh: bool = False,
+    ) -> list[SheetProperties]:
+        """Get the properties of every sheet, in order, cached per spreadsheet.
 
+        Only `sheets.properties` is fetched. Sheets added, removed or
+        renamed by other means, and grids grown by writes, are only
+        seen after `invalidate_properties` or with `refresh`.
+        """
+        with self._properties_lock:
+            cached = self._properties.get(spreadsheet_id)
+        if cached is not None and not refresh:
+            return cached
         spreadsheet: Spreadsheet = self.service.get(
             spreadsheetId=spreadsheet_id,
+            fields="sheets.properties",
         ).execute()
-        if sheet_title:
-            sheets = filter(
-                lambda sh: (
-                    sh.get("properties", {}).get("title", "") == sheet_title
+        properties = [
+            sheet["properties"] for sheet in spreadsheet.get("sheets", [])
+        ]
+        with self._properties_lock:
+            self._properties[spreadsheet_id] = properties
+        return properties
+
+    def invalidate_properties(self, spreadsheet_id: str | None = None) -> None:
+        """Drop the cached properties of a spreadsheet, or of all of them."""
+        with self._properties_lock:
+            if spreadsheet_id is None:
+                self._properties.clear()
+            else:
+                self._properties.pop(spreadsheet_id, None)
+
+    def get_sheet_properties(
+        self,
+        spreadsheet_id: str,
+        sheet_title: str = "",
+        sheet_index: int | None = None,
+    ) -> SheetProperties:
+        """Find a sheet by title, else by index, defaulting to the first.
+
+        The cache is refreshed once when the title is not found.
+        """
+        properties = self.get_sheets_properties(spreadsheet_id)
+        if not sheet_title:
+            return properties[sheet_index or 0]
+
+        def find(properties: list[SheetProperties]) -> SheetProperties | None:
+            return next(
+                (
+                    sh
+                    for sh in properties
+                    if sh.get("title", "") == sheet_title
                 ),
-                spreadsheet.get("sheets", []),
+                None,
             )
-            first_sheet = next(iter(sheets), None)
-            if not first_sheet:
-                raise ValueError(f"sheet titled {sheet_title} not found")
-            sheet_id = first_sheet["properties"]["sheetId"]
-        elif sheet_index:
-            sheet: Sheet = spreadsheet.get("sheets", [])[sheet_index]
-            sheet_id = sheet["properties"]["sheetId"]
-
-        gridrange = {
-            "sheetId": sheet_id,
-            "startRowIndex": int(srow) - 1 if srow else None,
-            "endRowIndex": int(erow) - 1 if erow else None,
-            "startColumnIndex": col2num(scol) - 1,
-            "endColumnIndex": col2num(ecol) if ecol else None,
-        }
 
-        return cast(
-            "GridRange",
-            {k: v for k, v in gridrange.items() if v is not None},
+        sheet = find(properties) or find(
+            self.get_sheets_properties(spreadsheet_id, refresh=True),
         )
+        if sheet is None:
+            raise ValueError(f"sheet titled {sheet_title} not found")
+        return sheet
+
+    def _a1notation_to_gridrange(
+        self,
+        spreadsheet_id: str,
+        a1notation: str,
+        sheet_title: str = "",
+        sheet_index: int | None = None,
+    ) -> GridRange:
+        """Convert a range to a grid range of its sheet.
+
+        A notation without a sheet, such as `A1`, names a sheet when one
+        has this exact title.
+        """
+        titles: frozenset[str] = frozenset()
+        if "!" not in a1notation:
+            titles = frozenset(
+                sh.get("title", "")
+                for sh in self.get_sheets_properties(spreadsheet_id)
+            )
+        range_ = a1.parse(a1notation, titles)
+        sheet_title = range_.title or sheet_title
+        sheet_id = 0
+        if sheet_title or sheet_index:
+            sheet_id = self.get_sheet_properties(
+                spreadsheet_id,
+                sheet_title,
+                sheet_index,
+            )["sheetId"]
+        return range_.to_gridrange(sheet_id)
 
     def create_sheet(
         self,
@@ -116,6 +175,7 @@ class SpreadsheetsHelper:
         self,
         sheet_id: str,
         ranges: list[str],
+        value_render_option: ValueRenderOption = "FORMATTED_VALUE",
     ) -> BatchGetValuesResponse:
         # https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets.values/batchGet
         return (
@@ -123,6 +183,7 @@ class SpreadsheetsHelper:
             .batchGet(
                 spreadsheetId=sheet_id,
                 ranges=ranges,
+                valueRenderOption=value_render_option,
             )
             .execute()
         )
@@ -149,35 +210,67 @@ class SpreadsheetsHelper:
             .execute()
         )
 
-    def update_currency_format(
+    def batch_update_values(
         self,
         sheet_id: str,
-        range_: str | GridRange,
-    ) -> BatchUpdateSpreadsheetResponse:
-        if isinstance(range_, str):
-            range_ = self._a1notation_to_gridrange(sheet_id, range_)
+        data: list[ValueRange],
+        value_input_option: ValueInputOption = "USER_ENTERED",
+    ) -> BatchUpdateValuesResponse:
+        # https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets.values/batchUpdate
+        return (
+            self.service.values()
+            .batchUpdate(
+                spreadsheetId=sheet_id,
+                body={
+                    "valueInputOption": value_input_option,
+                    "data": data,
+                },
+            )
+            .execute()
+        )
 
+    def batch_update(
+        self,
+        sheet_id: str,
+        requests: list[Request],
+    ) -> BatchUpdateSpreadsheetResponse:
+        # https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/batchUpdate
         return self.service.batchUpdate(
             spreadsheetId=sheet_id,
-            body={
-                "requests": [
-                    {
-                        "repeatCell": {
-                            "range": range_,
-                            "cell": {
-                                "userEnteredFormat": {
-                                    "numberFormat": {
-                                        "type": "CURRENCY",
-                                        "pattern": "#,##0.00",
-                                    },
-                                },
-                            },
-                            "fields": "userEnteredFormat.numberFormat",
+            body={"requests": requests},
+        ).execute()
+
+    def currency_format_request(
+        self,
+        sheet_id: str,
+        range_: str | GridRange,
+    ) -> Request:
+        if isinstance(range_, str):
+            range_ = self._a1notation_to_gridrange(sheet_id, range_)
+        return {
+            "repeatCell": {
+                "range": range_,
+                "cell": {
+                    "userEnteredFormat": {
+                        "numberFormat": {
+                            "type": "CURRENCY",
+                            "pattern": "#,##0.00",
                         },
                     },
-                ],
+                },
+                "fields": "userEnteredFormat.numberFormat",
             },
-        ).execute()
+        }
+
+    def update_currency_format(
+        self,
+        sheet_id: str,
+        range_: str | GridRange,
+    ) -> BatchUpdateSpreadsheetResponse:
+        return self.batch_update(
+            sheet_id,
+            [self.currency_format_request(sheet_id, range_)],
+        )
 
     def clear_values(
         self,
@@ -1 +1,13 @@
+from typing import Literal
+
 type SheetsData = list[list[str]]
+type ValueInputOption = Literal[
+    "INPUT_VALUE_OPTION_UNSPECIFIED",
+    "RAW",
+    "USER_ENTERED",
+]
+type ValueRenderOption = Literal[
+    "FORMATTED_VALUE",
+    "UNFORMATTED_VALUE",
+    "FORMULA",
+]
@@ -0,0 +1,96 @@
+import pytest
+
+from arms.googleapi.helpers.a1 import (
+    A1Range,
+    coalesce,
+    col2num,
+    num2col,
+    parse,
+)
+
+
+@pytest.mark.parametrize(
+    ("a1", "expected"),
+    [
+        ("Sheet1", A1Range("Sheet1")),
+        ("Sheet1!A2:B", A1Range("Sheet1", 2, 1, None, 2)),
+        ("1:3", A1Range("", 1, None, 3, None)),
+        ("C3:A1", A1Range("", 1, 1, 3, 3)),
+        ("'It''s'!Z9", A1Range("It's", 9, 26, 9, 26)),
+        ("x!B:B", A1Range("x", None, 2, None, 2)),
+        ("A1:ZZ", A1Range("", 1, 1, None, 702)),
+        ("ABC", A1Range("", None, 731, None, 731)),
+    ],
+)
+def test_parse(a1: str, expected: A1Range) -> None:
+    assert parse(a1) == expected
+
+
+@pytest.mark.parametrize("a1", ["Sheet1!A2:B", "'It''s'!Z9", "A:A", "B2"])
+def test_parse_roundtrip(a1: str) -> None:
+    assert str(parse(a1)) == a1
+
+
+@pytest.mark.parametrize("a1", ["A0", "Sheet1!A0:B2", "A1:B0"])
+def test_parse_rejects_row_zero(a1: str) -> None:
+    with pytest.raises(ValueError, match="row 0"):
+        parse(a1)
+
+
+def test_parse_known_title() -> None:
+    assert parse("ABC", frozenset({"ABC"})) == A1Range("ABC")
+    assert parse("'ABC'") == A1Range("ABC")
+
+
+def test_to_gridrange() -> None:
+    assert parse("B2:C3").to_gridrange(7) == {
+        "sheetId": 7,
+        "startRowIndex": 1,
+        "endRowIndex": 3,
+        "startColumnIndex": 1,
+        "endColumnIndex": 3,
+    }
+
+
+def test_columns() -> None:
+    assert [num2col(num) for num in (1, 26, 27, 702, 703)] == [
+        "A",
+        "Z",
+        "AA",
+        "ZZ",
+        "AAA",
+    ]
+    assert num2col(col2num("zz")) == "ZZ"
+    with pytest.raises(ValueError, match="column"):
+        num2col(0)
+
+
+def test_coalesce() -> None:
+    ranges = [
+        parse("S!A1:B2"),
+        parse("S!C1:C2"),
+        parse("S!E5"),
+        parse("T!A1"),
+        parse("S!A:A"),
+    ]
+    assert set(coalesce(ranges)) == {
+        parse("S!A1:C2"),
+        parse("S!E5"),
+        parse("T!A1"),
+        parse("S!A:A"),
+    }
+
+
+def test_coalesce_transitive() -> None:
+    ranges = [A1Range("", 1, 1, 1, 1), A1Range("", 3, 3, 3, 3)]
+    assert sorted(coalesce(ranges), key=str) == sorted(ranges, key=str)
+    ranges.append(A1Range("", 2, 2, 2, 2))
+    assert coalesce(ranges) == [A1Range("", 1, 1, 3, 3)]
+
+
+def test_contains() -> None:
+    assert parse("S!A:B").contains(parse("S!B7"))
+    assert parse("S!A1:C3").contains(parse("S!B2:C3"))
+    assert not parse("S!A1:C3").contains(parse("S!B2:D3"))
+    assert not parse("S!A1:C3").contains(parse("S!A:A"))
+    assert not parse("S!A1:C3").contains(parse("T!A1"))
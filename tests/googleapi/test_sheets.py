@@ -0,0 +1,62 @@
+from arms.googleapi.facades.sheets import GoogleSheet
+
+
+def test_diff_blocks_unchanged() -> None:
+    assert GoogleSheet.diff_blocks([["a", "b"]], [["a", "b"]]) == []
+
+
+def test_diff_blocks_stacks_runs() -> None:
+    current = [["a", "b", "c"], ["d", "e", "f"], ["g", "h", "i"]]
+    data = [["a", "B", "C"], ["d", "E", "F"], ["g", "h", "I"]]
+    assert GoogleSheet.diff_blocks(current, data) == [
+        (0, 1, [["B", "C"], ["E", "F"]]),
+        (2, 2, [["I"]]),
+    ]
+
+
+def test_diff_blocks_clears_missing_cells() -> None:
+    current = [["a", "b"], ["c"]]
+    data = [["a"]]
+    assert GoogleSheet.diff_blocks(current, data) == [
+        (0, 1, [[""]]),
+        (1, 0, [[""]]),
+    ]
+
+
+def test_diff_blocks_compares_as_strings() -> None:
+    assert GoogleSheet.diff_blocks([["1", "x"]], [[1, "y"]]) == [
+        (0, 1, [["y"]]),
+    ]
+
+
+def test_diff_blocks_accepts_formatted_values() -> None:
+    current = [["45658", "=A1+1"], ["1234.5"]]
+    formatted = [["2025-01-01", "2025-01-02"], ["$1,234.50"]]
+    data = [["2025-01-01", "=A1+1"], ["$1,234.50", "x"]]
+    assert GoogleSheet.diff_blocks(current, data, formatted) == [
+        (1, 1, [["x"]]),
+    ]
+
+
+def test_chunk_rows_by_rows() -> None:
+    rows = [[str(i)] for i in range(5)]
+    assert [len(chunk) for chunk in GoogleSheet.chunk_rows(rows, 2)] == [
+        2,
+        2,
+        1,
+    ]
+
+
+def test_chunk_rows_by_bytes() -> None:
+    rows = iter([["a" * 10]] * 5)
+    chunks = list(GoogleSheet.chunk_rows(rows, max_bytes=30))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+
+def test_chunk_rows_oversized_row() -> None:
+    chunks = list(GoogleSheet.chunk_rows([["a" * 100], ["b"]], max_bytes=10))
+    assert chunks == [[["a" * 100]], [["b"]]]
+
+
+def test_chunk_rows_empty() -> None:
+    assert list(GoogleSheet.chunk_rows([])) == []
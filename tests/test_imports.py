@@ -0,0 +1,24 @@
+import subprocess
+import sys
+
+import pytest
+
+HeavyModules = ("bs4", "lxml", "googleapiclient", "google.auth")
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["arms.confluence.pool", "arms.googleapi.facades.aio"],
+)
+def test_import_skips_heavy_dependencies(module: str) -> None:
+    code = (
+        f"import sys, {module}; "
+        f"print(*sorted({set(HeavyModules)!r} & sys.modules.keys()))"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert not result.stdout.strip()